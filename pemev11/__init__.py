@@ -0,0 +1,90 @@
+"""
+PEMEV-11: Planetary Energy Mastery Ethical Vector (QAI Project / QERRA Vector 11)
+
+Importing the package has no side effects; matplotlib and requests are only
+imported when plotting or QDay seeding is actually used.
+"""
+
+from pemev11.batch import EVALUATION_DTYPE, GUIDANCE_TEXT, Evaluation, Guidance, evaluate_paths, format_evaluations
+from pemev11.boundary import min_equity, min_growth, min_sustainability
+from pemev11.cache import ResultCache, cache_key, cached_evaluate_paths, get_default_cache
+from pemev11.coalitions import coalition_loss_distribution
+from pemev11.engine import PRESETS, ScoringEngine, preset_engine
+from pemev11.history import HISTORY_DTYPE, HistoricalDataset, convert_csv
+from pemev11.landscape import LandscapeGrid, build_landscape_grid
+from pemev11.montecarlo import RECOMMEND_PROBABILITY_DTYPE, recommend_probability
+from pemev11.pareto import (PARETO_OBJECTIVES, frontier_file, iter_pareto_frontier, pareto_frontier,
+                            pareto_mask)
+from pemev11.qday import QDayEntropyPool, fetch_quantum_random_bytes, get_default_pool
+from pemev11.regions import REGIONAL_DTYPE, evaluate_region_grid, evaluate_regions
+from pemev11.remorse import REMORSE_SUMMARY_DTYPE, RemorseLedger
+from pemev11.scoreindex import ScoreIndex, index_file, open_score_index
+from pemev11.seeding import SeedJournal, get_default_journal, new_seed_sequence
+from pemev11.sensitivity import SENSITIVITY_DTYPE, score_sensitivity
+from pemev11.simplex import RECOMMEND_REGION_DTYPE, recommend_area_fraction, recommend_region
+from pemev11.stream import evaluate_file
+from pemev11.trajectory import TRAJECTORY_DTYPE, iter_trajectories, simulate_trajectories
+from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+from pemev11.visual import LandscapeTemplate, landscape_variant, render_landscapes
+from pemev11.wstate import SparseWState, w_state_bonus
+
+__all__ = [
+    "EVALUATION_DTYPE",
+    "Evaluation",
+    "GUIDANCE_TEXT",
+    "Guidance",
+    "HISTORY_DTYPE",
+    "HistoricalDataset",
+    "LandscapeGrid",
+    "LandscapeTemplate",
+    "PARETO_OBJECTIVES",
+    "PRESETS",
+    "PlanetaryEnergyMasteryEthicalVector",
+    "QDayEntropyPool",
+    "RECOMMEND_PROBABILITY_DTYPE",
+    "RECOMMEND_REGION_DTYPE",
+    "REGIONAL_DTYPE",
+    "REMORSE_SUMMARY_DTYPE",
+    "RemorseLedger",
+    "ResultCache",
+    "SENSITIVITY_DTYPE",
+    "ScoreIndex",
+    "ScoringEngine",
+    "SeedJournal",
+    "SparseWState",
+    "TRAJECTORY_DTYPE",
+    "build_landscape_grid",
+    "cache_key",
+    "cached_evaluate_paths",
+    "coalition_loss_distribution",
+    "convert_csv",
+    "evaluate_file",
+    "evaluate_paths",
+    "evaluate_region_grid",
+    "evaluate_regions",
+    "fetch_quantum_random_bytes",
+    "format_evaluations",
+    "frontier_file",
+    "get_default_cache",
+    "get_default_journal",
+    "get_default_pool",
+    "index_file",
+    "iter_pareto_frontier",
+    "iter_trajectories",
+    "landscape_variant",
+    "min_equity",
+    "min_growth",
+    "min_sustainability",
+    "new_seed_sequence",
+    "open_score_index",
+    "pareto_frontier",
+    "pareto_mask",
+    "preset_engine",
+    "recommend_area_fraction",
+    "recommend_probability",
+    "recommend_region",
+    "render_landscapes",
+    "score_sensitivity",
+    "simulate_trajectories",
+    "w_state_bonus",
+]
@@ -0,0 +1,177 @@
+import argparse
+import sys
+
+from pemev11.bench import IMPORT_BUDGET_MS, measure_cold_import
+
+
+def check_import_budget(budget_ms=IMPORT_BUDGET_MS):
+    elapsed, loaded = measure_cold_import()
+    print(f"Cold import: {elapsed:.1f} ms (budget {budget_ms} ms)")
+    if loaded:
+        print(f"Heavy modules imported eagerly: {', '.join(loaded)}")
+    return elapsed <= budget_ms and not loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pemev11", description="PEMEV-11 Ethical Vector")
+    parser.add_argument("--quantum", action="store_true", help="seed weights from QDay quantum randomness")
+    parser.add_argument("--seed-journal", help="journal seed material here (JSON Lines) for bit-for-bit replay")
+    parser.add_argument("--replay-seed", metavar="ENTRY_ID", help="seed weights from a journal entry instead of QDay")
+    parser.add_argument("--metrics", help="record instrumentation and write it here on exit (.json or .prom text)")
+    parser.add_argument("--history", help="HistoricalDataset directory to take the current state from")
+    parser.add_argument("--year", type=int, help="year of --history to use (default: latest)")
+    parser.add_argument("--region", action="append", help="restrict --history to these regions (repeatable)")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("baseline", help="print the current Kardashev baseline")
+
+    evaluate = sub.add_parser("evaluate", help="evaluate one path")
+    evaluate.add_argument("growth_factor", type=float)
+    evaluate.add_argument("years", type=float)
+    evaluate.add_argument("--equity", type=float, default=None)
+    evaluate.add_argument("--sustainability", type=float, default=None)
+
+    visualize = sub.add_parser("visualize", help="save the ethical landscape plot")
+    visualize.add_argument("--output", default="ethical_landscape.png")
+    visualize.add_argument("--cache", action="store_true", help="reuse the cached figure for unchanged parameters")
+
+    render = sub.add_parser("render", help="render landscape variants (weight profile x threshold) in parallel")
+    render.add_argument("output_dir")
+    render.add_argument("--weights", type=float, nargs=3, action="append",
+                        metavar=("ENERGY", "EQUITY", "SUSTAINABILITY"),
+                        help="weight profile (repeatable; default: the vector's own weights)")
+    render.add_argument("--thresholds", type=float, nargs="+", help="ethical thresholds (default: the vector's own)")
+    render.add_argument("--workers", type=int, default=None)
+
+    grid = sub.add_parser("grid", help="generate (or resume) the memory-mapped 3D landscape grid")
+    grid.add_argument("path")
+    grid.add_argument("--resolution", type=int, nargs=3, default=(4096, 512, 512),
+                      metavar=("GROWTH", "EQUITY", "SUSTAINABILITY"))
+    grid.add_argument("--tile-size", type=int, default=64)
+
+    stream = sub.add_parser("stream", help="evaluate a CSV/.npy scenario file into .npy/.csv results")
+    stream.add_argument("input")
+    stream.add_argument("output")
+    stream.add_argument("--chunk-rows", type=int, default=1_000_000)
+
+    frontier = sub.add_parser("frontier", help="Pareto frontier of a CSV/.npy scenario file into .npy/.csv")
+    frontier.add_argument("input")
+    frontier.add_argument("output")
+    frontier.add_argument("--chunk-rows", type=int, default=1_000_000)
+
+    index = sub.add_parser("index", help="append a CSV/.npy scenario file to a sorted score index and count RECOMMENDs")
+    index.add_argument("input")
+    index.add_argument("path")
+    index.add_argument("--chunk-rows", type=int, default=1_000_000)
+    index.add_argument("--thresholds", type=float, nargs="+", default=[0.90, 0.95, 0.98])
+
+    serve = sub.add_parser("serve", help="run the micro-batching scoring service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8711)
+    serve.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    serve.add_argument("--window-ms", type=float, default=2.0, help="request coalescing window")
+
+    bench = sub.add_parser("bench", help="benchmark scoring/projection hot paths")
+    bench.add_argument("--output", help="write machine-readable JSON results here")
+    bench.add_argument("--baseline", help="fail on regressions against this stored JSON baseline")
+    bench.add_argument("--save-baseline", help="store these results as the new baseline")
+    bench.add_argument("--full", action="store_true", help="include the 1e8-scenario batch size")
+    bench.add_argument("--tolerance", type=float, default=0.25, help="allowed throughput drop (fraction)")
+
+    history = sub.add_parser("history", help="convert a raw historical CSV into a memory-mapped dataset")
+    history.add_argument("csv")
+    history.add_argument("path")
+
+    budget = sub.add_parser("import-budget", help="enforce the cold-import time budget")
+    budget.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+
+    args = parser.parse_args(argv)
+    if args.metrics:
+        from pemev11 import metrics
+        metrics.enable()
+        try:
+            return run(args)
+        finally:
+            metrics.export(args.metrics)
+    return run(args)
+
+
+def run(args):
+    if args.command == "import-budget":
+        return 0 if check_import_budget(args.budget_ms) else 1
+    if args.command == "bench":
+        from pemev11 import bench
+        return bench.main(args.output, args.baseline, args.save_baseline,
+                          bench.FULL_SIZES if args.full else bench.DEFAULT_SIZES, args.tolerance)
+
+    if args.command == "history":
+        from pemev11.history import convert_csv
+        dataset = convert_csv(args.csv, args.path)
+        print(f"{len(dataset)} rows, {len(dataset.region_names)} regions, "
+              f"years {dataset.years[0]}-{dataset.years[-1]} → {args.path}")
+        return 0
+
+    from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+    vector = PlanetaryEnergyMasteryEthicalVector(use_quantum=args.quantum and not args.replay_seed,
+                                                 seed_journal=args.seed_journal)
+    if args.replay_seed:
+        vector.seed_weights_with_quantum_randomness(replay=args.replay_seed)
+    if args.history:
+        from pemev11.history import HistoricalDataset
+        dataset = HistoricalDataset(args.history)
+        vector.load_history(dataset, args.year if args.year is not None else dataset.years[-1], args.region)
+
+    if args.command == "evaluate":
+        vector.evaluate_path_ethical(args.growth_factor, args.years, args.equity, args.sustainability)
+    elif args.command == "visualize":
+        if args.cache:
+            from pemev11.cache import cached_visualize_ethical_landscape
+            cached_visualize_ethical_landscape(vector, args.output)
+        else:
+            from pemev11.visual import visualize_ethical_landscape
+            visualize_ethical_landscape(vector, args.output)
+    elif args.command == "render":
+        import os
+        from pemev11.visual import landscape_variant, render_landscapes
+        os.makedirs(args.output_dir, exist_ok=True)
+        variants = []
+        profiles = args.weights or [(vector.weight_energy, vector.weight_equity, vector.weight_sustainability)]
+        for weights in profiles:
+            for threshold in args.thresholds or [vector.ethical_threshold]:
+                variant = landscape_variant(vector, os.path.join(
+                    args.output_dir, f"landscape_w{'-'.join(f'{w:g}' for w in weights)}_t{threshold:g}.png"))
+                variant["scoring"].update(weights=tuple(weights), ethical_threshold=threshold)
+                variants.append(variant)
+        paths = render_landscapes(variants, args.workers)
+        print(f"Rendered {len(paths)} landscapes → {args.output_dir}")
+    elif args.command == "grid":
+        from pemev11.landscape import build_landscape_grid
+        build_landscape_grid(vector, args.path, tuple(args.resolution), tile_size=args.tile_size,
+                             progress=lambda done, total: print(f"Tiles {done}/{total}", end="\r"))
+        print(f"\nLandscape grid written to {args.path}")
+    elif args.command == "stream":
+        from pemev11.stream import evaluate_file
+        rows = evaluate_file(args.input, args.output, vector, chunk_rows=args.chunk_rows)
+        print(f"Evaluated {rows} scenarios → {args.output}")
+    elif args.command == "frontier":
+        from pemev11.pareto import frontier_file
+        rows = frontier_file(args.input, args.output, vector, chunk_rows=args.chunk_rows)
+        print(f"{rows} non-dominated paths → {args.output}")
+    elif args.command == "index":
+        from pemev11.scoreindex import index_file
+        index = index_file(args.input, args.path, vector, chunk_rows=args.chunk_rows)
+        thresholds = sorted(args.thresholds)
+        for threshold, recommended in zip(thresholds, index.count_recommended(thresholds)):
+            print(f"Threshold {threshold:.2f}: {recommended}/{len(index)} RECOMMEND")
+        for low, high in zip(thresholds, thresholds[1:]):
+            print(f"Flip {low:.2f} → {high:.2f}: {index.count_range(low, high)} paths")
+    elif args.command == "serve":
+        from pemev11.service import serve
+        serve(args.host, args.port, args.unix, args.window_ms / 1000, vector)
+    else:
+        vector.print_baseline()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
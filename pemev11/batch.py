@@ -0,0 +1,169 @@
+import enum
+
+import numpy as np
+
+from pemev11.metrics import instrumented
+
+
+class Guidance(enum.IntEnum):
+    """Guidance verdict stored in the batch result array."""
+    REJECT = 0
+    RECOMMEND = 1
+
+
+GUIDANCE_TEXT = {
+    Guidance.REJECT: "REJECT — Risk of misalignment or future remorse",
+    Guidance.RECOMMEND: "RECOMMEND — Aligned with remorse-free flourishing",
+}
+
+# Kardashev level of today's ~23 TW, the zero point of k_progress
+CURRENT_KARDASHEV = 0.736
+
+# evaluate_paths works through the result in blocks of this many paths, using two contiguous
+# scratch rows of this length (1 MiB) as its only memory besides the result buffer
+EVALUATION_BLOCK = 65536
+
+EVALUATION_DTYPE = np.dtype([
+    ("growth_factor", "f8"),
+    ("years", "f8"),
+    ("equity", "f8"),
+    ("sustainability", "f8"),
+    ("future_k", "f8"),
+    ("k_progress", "f8"),
+    ("ethical_score", "f8"),
+    ("remorse_horizon", "f8"),
+    ("guidance", "i1"),
+])
+
+
+def kardashev_progress(growth_factor, current_power_watts=2.3e13):
+    """Vectorized k_progress: normalized Kardashev progress from today, clamped at 1.0."""
+    future_k = (np.log10(np.asarray(growth_factor, dtype=np.float64)) + np.log10(current_power_watts) - 6) / 10
+    return np.minimum((future_k - CURRENT_KARDASHEV) / (1.0 - CURRENT_KARDASHEV), 1.0)
+
+
+@instrumented("evaluate_paths", batch_size=np.size)
+def evaluate_paths(growth_factor, years, equity_score, sustainability_score,
+                   current_power_watts=2.3e13, weights=(0.3, 0.4, 0.3),
+                   ethical_threshold=0.95, base_remorse_horizon=-1.00,
+                   robustness_bonus=0.0, k_progress_cap=1.0):
+    """
+    Vectorized evaluate_path_ethical.
+    Inputs broadcast against each other; returns a record array of EVALUATION_DTYPE.
+    k_progress_cap=None disables the min(..., 1.0) clamp; base_remorse_horizon=None
+    (variants without the remorse link) leaves remorse_horizon as NaN.
+    """
+    growth_factor, years, equity_score, sustainability_score = np.broadcast_arrays(
+        np.asarray(growth_factor, dtype=np.float64),
+        np.asarray(years, dtype=np.float64),
+        np.asarray(equity_score, dtype=np.float64),
+        np.asarray(sustainability_score, dtype=np.float64),
+    )
+    weight_energy, weight_equity, weight_sustainability = weights
+
+    out = np.empty(growth_factor.shape, dtype=EVALUATION_DTYPE)
+    out["growth_factor"] = growth_factor
+    out["years"] = years
+    out["equity"] = equity_score
+    out["sustainability"] = sustainability_score
+
+    # The record fields are strided, and arithmetic directly on them is markedly slower; each
+    # block is computed in contiguous scratch and every result copied into its field once.
+    flat = out.reshape(-1)
+    growth_factor, equity_score, sustainability_score = flat["growth_factor"], flat["equity"], flat["sustainability"]
+    future_k, k_progress, score = flat["future_k"], flat["k_progress"], flat["ethical_score"]
+    remorse_horizon, guidance = flat["remorse_horizon"], flat["guidance"]
+    # K = (log10(P0 * g) - 6) / 10, with log10(P0) folded into a constant
+    k_offset = np.log10(current_power_watts) - 6
+    scratch = np.empty((2, min(EVALUATION_BLOCK, len(flat))))
+    for lo in range(0, len(flat), EVALUATION_BLOCK):
+        hi = min(lo + EVALUATION_BLOCK, len(flat))
+        work, term = scratch[0, :hi - lo], scratch[1, :hi - lo]
+
+        np.log10(growth_factor[lo:hi], out=work)
+        work += k_offset
+        work /= 10
+        future_k[lo:hi] = work
+
+        work -= CURRENT_KARDASHEV
+        work /= (1.0 - CURRENT_KARDASHEV)
+        if k_progress_cap is not None:
+            np.minimum(work, k_progress_cap, out=work)
+        k_progress[lo:hi] = work
+
+        work *= weight_energy
+        np.multiply(equity_score[lo:hi], weight_equity, out=term)
+        work += term
+        np.multiply(sustainability_score[lo:hi], weight_sustainability, out=term)
+        work += term
+        work += robustness_bonus
+        score[lo:hi] = work
+
+        # Perfect ethical = base remorse, low ethical raises remorse risk
+        if base_remorse_horizon is not None:
+            np.subtract(base_remorse_horizon + 1.0, work, out=remorse_horizon[lo:hi])
+        np.greater_equal(work, ethical_threshold, out=guidance[lo:hi], casting="unsafe")
+    if base_remorse_horizon is None:
+        remorse_horizon.fill(np.nan)
+    return out
+
+
+class Evaluation:
+    """
+    One path's result (the fields of EVALUATION_DTYPE plus the threshold it was judged
+    against). Plain attributes, no text: the report is only built by str() / report().
+    """
+
+    __slots__ = EVALUATION_DTYPE.names + ("ethical_threshold",)
+
+    def __init__(self, growth_factor, years, equity, sustainability, future_k, k_progress, ethical_score,
+                 remorse_horizon, guidance, ethical_threshold=0.95):
+        self.growth_factor = growth_factor
+        self.years = years
+        self.equity = equity
+        self.sustainability = sustainability
+        self.future_k = future_k
+        self.k_progress = k_progress
+        self.ethical_score = ethical_score
+        self.remorse_horizon = remorse_horizon
+        self.guidance = Guidance(guidance)
+        self.ethical_threshold = ethical_threshold
+
+    @classmethod
+    def from_record(cls, record, ethical_threshold=0.95):
+        """From one EVALUATION_DTYPE row (or a 0-d / length-1 result array)."""
+        record = np.asarray(record, dtype=EVALUATION_DTYPE).reshape(-1)[0]
+        return cls(*(record[name].item() for name in EVALUATION_DTYPE.names), ethical_threshold)
+
+    @property
+    def recommended(self):
+        return self.guidance is Guidance.RECOMMEND
+
+    def to_record(self):
+        return np.array(tuple(getattr(self, name) for name in EVALUATION_DTYPE.names), dtype=EVALUATION_DTYPE)
+
+    def report(self):
+        return format_evaluations(self.to_record(), self.ethical_threshold)
+
+    __str__ = report
+
+    def __repr__(self):
+        return (f"Evaluation(growth_factor={self.growth_factor:g}, years={self.years:g}, "
+                f"ethical_score={self.ethical_score:.3f}, guidance={self.guidance.name})")
+
+
+def format_evaluations(results, ethical_threshold=0.95):
+    """Human-readable report for a batch result array (one block per path)."""
+    blocks = []
+    for row in np.atleast_1d(results):
+        guidance = GUIDANCE_TEXT[Guidance(int(row["guidance"]))]
+        # NaN remorse: variant without the remorse link, which never reported it
+        remorse = "" if np.isnan(row["remorse_horizon"]) else f" | Remorse horizon: {row['remorse_horizon']:.2f}"
+        blocks.append(
+            f"Ethical Evaluation: {row['growth_factor']:g}x growth over ~{row['years']:g} years\n"
+            f"Projected Kardashev: {row['future_k']:.3f}\n"
+            f"Equity: {row['equity']:.2f} | Sustainability: {row['sustainability']:.2f}\n"
+            f"Ethical score: {row['ethical_score']:.3f} (threshold {ethical_threshold}){remorse}\n"
+            f"Guidance: {guidance}\n"
+        )
+    return "\n".join(blocks)
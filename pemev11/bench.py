@@ -0,0 +1,195 @@
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+# Cold `import pemev11` budget (numpy dominates); heavy optional modules must stay unloaded
+IMPORT_BUDGET_MS = 250
+LAZY_MODULES = ("matplotlib", "requests")
+# Interpreter start-up jitter tolerated on top of the relative tolerance
+COLD_IMPORT_SLACK_MS = 20
+
+DEFAULT_SIZES = (1, 1_000, 1_000_000)
+FULL_SIZES = DEFAULT_SIZES + (100_000_000,)
+
+# Batches above this are scored chunk by chunk (a 1e8 batch would need ~10 GB at once)
+MAX_CHUNK = 1_000_000
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import pemev11\n"
+    "elapsed = (time.perf_counter() - t) * 1000\n"
+    "print(elapsed)\n"
+    "print(' '.join(m for m in {lazy!r} if m in sys.modules))\n"
+)
+
+
+def measure_cold_import(repeats=3):
+    """Best-of-N cold import time (ms) in fresh interpreters, plus any eagerly loaded heavy modules."""
+    best, loaded = float("inf"), set()
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE.format(lazy=LAZY_MODULES)],
+                             capture_output=True, text=True, check=True).stdout.splitlines()
+        best = min(best, float(out[0]))
+        loaded.update(out[1].split() if len(out) > 1 else [])
+    return best, sorted(loaded)
+
+
+def _scenarios(size, rng):
+    size = min(size, MAX_CHUNK)
+    return (10 ** rng.uniform(0, 4, size), rng.uniform(0, 100, size),
+            rng.uniform(0, 1, size), rng.uniform(0, 1, size))
+
+
+def _chunked(size, func):
+    """Run func(chunk_size) over `size` scenarios in MAX_CHUNK pieces."""
+    def run():
+        remaining = size
+        while remaining > 0:
+            func(min(remaining, MAX_CHUNK))
+            remaining -= MAX_CHUNK
+    return run
+
+
+def hot_paths(vector, size, rng, workdir):
+    """(name, callable) pairs that each process `size` scenarios once."""
+    growth, years, equity, sustainability = _scenarios(size, rng)
+    power = vector.current_power_watts * growth
+
+    def quiet(func, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            func(*args, **kwargs)
+
+    benches = [
+        ("calculate_kardashev", _chunked(size, lambda n: vector.calculate_kardashev(power[:n]))),
+        ("ethical_score", _chunked(size, lambda n: vector.ethical_score(growth[:n], equity[:n], sustainability[:n]))),
+        ("evaluate_paths_ethical", _chunked(size, lambda n: vector.evaluate_paths_ethical(
+            growth[:n], years[:n], equity[:n], sustainability[:n]))),
+    ]
+    if size <= 1_000:
+        # Scalar, printing APIs: a Python loop of `size` calls
+        def scalar_loop(func):
+            def run():
+                for i in range(size):
+                    quiet(func, float(growth[i]), float(years[i]), float(equity[i]), float(sustainability[i]))
+            return run
+
+        benches += [
+            ("evaluate_path_ethical", scalar_loop(vector.evaluate_path_ethical)),
+            ("evaluate_path_ethical_quiet", scalar_loop(
+                lambda g, y, e, s: vector.evaluate_path_ethical(g, y, e, s, verbose=False))),
+            ("project_future", scalar_loop(lambda g, y, e, s: vector.project_future(g, y))),
+            ("w_state_robustness_bonus", lambda: [vector.w_state_robustness_bonus() for _ in range(size)]),
+        ]
+    if size == 1:
+        from pemev11.visual import visualize_ethical_landscape
+        path = os.path.join(workdir, "ethical_landscape.png")
+        benches.append(("visualize_ethical_landscape",
+                        lambda: quiet(visualize_ethical_landscape, vector, path)))
+    return benches
+
+
+def time_call(func, repeat=5, min_time=0.05):
+    """Best per-call seconds over `repeat` rounds, each looping until at least `min_time`."""
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = max(1, int(min_time / first)) if first > 0 else 1000
+    best = first
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_memory(func):
+    """Peak traced allocation (bytes) of one call; NumPy reports its buffers to tracemalloc."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=5, seed=0, progress=print):
+    from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    rng = np.random.default_rng(seed)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            for name, func in hot_paths(vector, size, rng, workdir):
+                seconds = time_call(func, repeat=1 if size > MAX_CHUNK else repeat)
+                result = {
+                    "name": name,
+                    "size": size,
+                    "seconds": seconds,
+                    "throughput": size / seconds,
+                    "peak_bytes": peak_memory(func),
+                }
+                results.append(result)
+                if progress:
+                    progress(f"{name:<28} n={size:<11,} {seconds * 1e3:10.3f} ms "
+                             f"{result['throughput']:14,.0f}/s  peak {result['peak_bytes'] / 2 ** 20:8.1f} MiB")
+
+    cold_ms, eager = measure_cold_import()
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "cold_import_ms": cold_ms,
+        "eager_heavy_modules": eager,
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance=0.25):
+    """Regressions: hot paths whose throughput fell more than `tolerance` below the baseline."""
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["name"], result["size"]))
+        if before and result["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(f"{result['name']} n={result['size']:,}: "
+                               f"{result['throughput']:,.0f}/s vs baseline {before['throughput']:,.0f}/s")
+    if report["cold_import_ms"] > baseline["cold_import_ms"] * (1 + tolerance) + COLD_IMPORT_SLACK_MS:
+        regressions.append(f"cold import: {report['cold_import_ms']:.1f} ms "
+                           f"vs baseline {baseline['cold_import_ms']:.1f} ms")
+    return regressions
+
+
+def main(output=None, baseline=None, save_baseline=None, sizes=DEFAULT_SIZES, tolerance=0.25):
+    report = run_benchmarks(sizes)
+    print(f"Cold import: {report['cold_import_ms']:.1f} ms")
+    for path in (output, save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Results written to {path}")
+
+    if baseline:
+        with open(baseline) as f:
+            regressions = compare(report, json.load(f), tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions against {baseline} (tolerance {tolerance:.0%})")
+    return 0
@@ -0,0 +1,61 @@
+import numpy as np
+
+from pemev11.batch import CURRENT_KARDASHEV, kardashev_progress
+
+# Closed-form RECOMMEND boundary of
+#   score = w_energy * min((K(g) - K0) / (1 - K0), 1) + w_equity * e + w_sustainability * s + bonus >= threshold
+# with K(g) = (log10(P0 * g) - 6) / 10.
+#
+# Returned minima are unclipped: a value <= 0 means the constraint is always met on [0, 1],
+# a value > 1 (or inf) means no equity/sustainability in range can reach the threshold.
+
+
+def _linear_minimum(required, weight):
+    """Smallest x with weight * x >= required (inf if impossible, -inf if always met)."""
+    required = np.asarray(required, dtype=np.float64)
+    if weight > 0:
+        return required / weight
+    return np.where(required <= 0, -np.inf, np.inf)
+
+
+def min_equity(growth_factor, sustainability_score, current_power_watts=2.3e13, weights=(0.3, 0.4, 0.3),
+               ethical_threshold=0.95, robustness_bonus=0.0):
+    """Minimum equity score needed for RECOMMEND at the given growth and sustainability."""
+    weight_energy, weight_equity, weight_sustainability = weights
+    required = (ethical_threshold - robustness_bonus
+                - weight_energy * kardashev_progress(growth_factor, current_power_watts)
+                - weight_sustainability * np.asarray(sustainability_score, dtype=np.float64))
+    return _linear_minimum(required, weight_equity)
+
+
+def min_sustainability(growth_factor, equity_score, current_power_watts=2.3e13, weights=(0.3, 0.4, 0.3),
+                       ethical_threshold=0.95, robustness_bonus=0.0):
+    """Minimum sustainability score needed for RECOMMEND at the given growth and equity."""
+    weight_energy, weight_equity, weight_sustainability = weights
+    required = (ethical_threshold - robustness_bonus
+                - weight_energy * kardashev_progress(growth_factor, current_power_watts)
+                - weight_equity * np.asarray(equity_score, dtype=np.float64))
+    return _linear_minimum(required, weight_sustainability)
+
+
+def min_growth(equity_score, sustainability_score, current_power_watts=2.3e13, weights=(0.3, 0.4, 0.3),
+               ethical_threshold=0.95, robustness_bonus=0.0):
+    """
+    Minimum growth factor needed for RECOMMEND at the given equity and sustainability.
+    inf when even the clamped k_progress of 1.0 (Type I) is not enough. When equity and
+    sustainability alone already pass, the boundary lies below 1 (shrinking power still passes),
+    so values < 1 mean "any growth >= that passes"; exactly 0 only when weight_energy is 0.
+    """
+    weight_energy, weight_equity, weight_sustainability = weights
+    required = (ethical_threshold - robustness_bonus
+                - weight_equity * np.asarray(equity_score, dtype=np.float64)
+                - weight_sustainability * np.asarray(sustainability_score, dtype=np.float64))
+    if weight_energy <= 0:
+        return np.where(required <= 0, 0.0, np.inf)
+
+    k_progress = required / weight_energy
+    future_k = CURRENT_KARDASHEV + k_progress * (1.0 - CURRENT_KARDASHEV)
+    with np.errstate(over="ignore"):
+        growth = 10.0 ** (10 * future_k + 6 - np.log10(current_power_watts))
+    # The clamp caps k_progress at 1.0: beyond that no amount of growth helps
+    return np.where(k_progress > 1.0, np.inf, growth)
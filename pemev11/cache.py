@@ -0,0 +1,168 @@
+import collections
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+# Bump when scoring or plotting output changes so stale entries are never served
+CACHE_VERSION = 1
+
+
+def cache_key(kind, params, *arrays):
+    """Content address: SHA-256 over the model parameters and the scenario arrays' bytes."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CACHE_VERSION, kind, params], sort_keys=True, default=float).encode())
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache for evaluation arrays and rendered figures.
+
+    Tier 1 is an in-process LRU of arrays; tier 2 is a directory of .npy/.png files keyed by
+    content hash, evicted least-recently-used first once it grows past `max_disk_bytes`.
+    """
+
+    def __init__(self, directory=None, memory_items=128, max_disk_bytes=1 << 30):
+        self.directory = directory or os.environ.get(
+            "PEMEV11_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "pemev11"))
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def get_array(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits["memory"] += 1
+                return self._memory[key]
+        path = self._path(key, ".npy")
+        try:
+            array = np.load(path)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # refresh disk LRU position
+        self._remember(key, array)
+        self.hits["disk"] += 1
+        return array
+
+    def put_array(self, key, array):
+        self._remember(key, array)
+        self._write(self._path(key, ".npy"), lambda f: np.save(f, array))
+
+    def get_or_compute(self, key, compute):
+        array = self.get_array(key)
+        if array is None:
+            self.misses += 1
+            array = compute()
+            self.put_array(key, array)
+        return array
+
+    def figure(self, key, path, render):
+        """Copy a cached figure to `path`, or call render(path) and cache the file."""
+        cached = self._path(key, ".png")
+        if os.path.exists(cached):
+            os.utime(cached)
+            self.hits["disk"] += 1
+            shutil.copyfile(cached, path)
+            return path
+        self.misses += 1
+        render(path)
+
+        def dump(f):
+            with open(path, "rb") as rendered:
+                shutil.copyfileobj(rendered, f)
+
+        self._write(cached, dump)
+        return path
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        for name in os.listdir(self.directory):
+            if name.endswith((".npy", ".png")):
+                os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key, array):
+        array.flags.writeable = False  # shared between callers: never mutate a cached result
+        with self._lock:
+            self._memory[key] = array
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _write(self, path, dump):
+        # Write to a temp file and rename, so concurrent readers never see partial entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            dump(f)
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith((".npy", ".png")):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResultCache:
+    """Process-wide cache under PEMEV11_CACHE_DIR (default ~/.cache/pemev11)."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+        return _default_cache
+
+
+def cached_evaluate_paths(vector, growth_factors, years, equity_scores=None, sustainability_scores=None,
+                          cache=None):
+    """vector.evaluate_paths_ethical, served from the cache when parameters and scenarios are unchanged."""
+    cache = cache or get_default_cache()
+    if equity_scores is None:
+        equity_scores = vector.current_equity
+    if sustainability_scores is None:
+        sustainability_scores = vector.current_sustainability
+    arrays = [np.asarray(a, dtype=np.float64) for a in (growth_factors, years, equity_scores, sustainability_scores)]
+    key = cache_key("evaluate_paths", vector.scoring_params(), *arrays)
+    return cache.get_or_compute(key, lambda: vector.evaluate_paths_ethical(*arrays))
+
+
+def cached_visualize_ethical_landscape(vector, path="ethical_landscape.png", cache=None):
+    """visualize_ethical_landscape, copying a cached PNG when the figure inputs are unchanged."""
+    from pemev11.visual import visualize_ethical_landscape
+
+    cache = cache or get_default_cache()
+    params = dict(vector.scoring_params(), current_equity=vector.current_equity,
+                  current_sustainability=vector.current_sustainability)
+    key = cache_key("ethical_landscape", params)
+    return cache.figure(key, path, lambda p: visualize_ethical_landscape(vector, p))
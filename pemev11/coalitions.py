@@ -0,0 +1,166 @@
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pemev11 import metrics
+from pemev11.wstate import SparseWState
+
+# Enumeration of every lost-stakeholder coalition L (2^N subsets) of a sparse W state.
+#
+# Stakeholder i is lost independently with probability q_i. For each L the survivors R keep
+# fidelity |sum_{i in R} a_i|^2 / |R| with the ideal W state on R (0 if fewer than 2 remain),
+# which maps to a bonus through the usual max(F - 0.8, 0) rule.
+#
+# Subsets are visited in reflected Gray-code order, so every subset differs from its
+# predecessor by one stakeholder and its survivor sum, survivor count and log-probability are
+# updated incrementally. The lowest `low_bits` stakeholders form a Gray-ordered table built by
+# reflection (each entry one flip from its mirror), the middle bits are walked one flip per step
+# against that whole table at once, and the top bits split the work across worker processes.
+
+MAX_STAKEHOLDERS = 40
+
+
+def _loss_logs(loss_probabilities):
+    """Finite log-probabilities of keep/lose plus flags for the impossible (probability 0) cases."""
+    q = np.asarray(loss_probabilities, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        log_lose = np.where(q > 0, np.log(np.where(q > 0, q, 1.0)), 0.0)
+        log_keep = np.where(q < 1, np.log(np.where(q < 1, 1 - q, 1.0)), 0.0)
+    return log_keep, log_lose, (q >= 1).astype(np.int32), (q <= 0).astype(np.int32)
+
+
+def gray_table(amplitudes, loss_probabilities):
+    """
+    Gray-ordered table over every subset of the given stakeholders: survivor amplitude sum,
+    lost count, log-probability, impossible-factor count and lost bitmask per subset.
+    """
+    log_keep, log_lose, impossible_keep, impossible_lose = _loss_logs(loss_probabilities)
+    sums = np.array([amplitudes.sum()])
+    lost = np.zeros(1, dtype=np.int32)
+    log_p = np.array([log_keep.sum()])
+    impossible = np.array([impossible_keep.sum()], dtype=np.int32)
+    masks = np.zeros(1, dtype=np.int64)
+    for j in range(len(amplitudes)):
+        # Reflect: mirrored half with stakeholder j flipped from kept to lost
+        sums = np.concatenate([sums, sums[::-1] - amplitudes[j]])
+        lost = np.concatenate([lost, lost[::-1] + 1])
+        log_p = np.concatenate([log_p, log_p[::-1] + (log_lose[j] - log_keep[j])])
+        impossible = np.concatenate([impossible, impossible[::-1] + (impossible_lose[j] - impossible_keep[j])])
+        masks = np.concatenate([masks, masks[::-1] | (1 << j)])
+    return sums, lost, log_p, impossible, masks
+
+
+def _enumerate_prefix(amplitudes, loss_probabilities, low_bits, middle_bits, prefixes, max_lost, bins):
+    """Worker: all coalitions whose top bits are in `prefixes`. Returns partial accumulators."""
+    n = len(amplitudes)
+    low_sums, low_lost, low_log_p, low_impossible, low_masks = gray_table(
+        amplitudes[:low_bits], loss_probabilities[:low_bits])
+    log_keep, log_lose, impossible_keep, impossible_lose = _loss_logs(loss_probabilities)
+
+    total_p = expected_bonus = expected_fidelity = 0.0
+    histogram = np.zeros(bins)
+    worst_bonus, worst_mask = np.inf, -1
+    high = np.arange(low_bits, n)
+
+    for prefix in prefixes:
+        # State of the non-table bits, built directly for this prefix with middle bits all kept
+        lost_high = np.zeros(n - low_bits, dtype=bool)
+        for k in range(n - low_bits - middle_bits):
+            lost_high[middle_bits + k] = (prefix >> k) & 1
+        kept = ~lost_high
+        high_sum = amplitudes[high][kept].sum()
+        high_lost = int(lost_high.sum())
+        high_log_p = log_keep[high][kept].sum() + log_lose[high][lost_high].sum()
+        high_impossible = int(impossible_keep[high][kept].sum() + impossible_lose[high][lost_high].sum())
+        high_mask = sum(1 << int(i) for i in high[lost_high])
+
+        for step in range(1 << middle_bits):
+            if step:
+                # Gray code: step i flips the bit at the position of i's lowest set bit
+                j = (step & -step).bit_length() - 1
+                i = low_bits + j
+                if lost_high[j]:
+                    high_sum += amplitudes[i]
+                    high_lost -= 1
+                    high_log_p += log_keep[i] - log_lose[i]
+                    high_impossible += impossible_keep[i] - impossible_lose[i]
+                else:
+                    high_sum -= amplitudes[i]
+                    high_lost += 1
+                    high_log_p += log_lose[i] - log_keep[i]
+                    high_impossible += impossible_lose[i] - impossible_keep[i]
+                lost_high[j] = not lost_high[j]
+                high_mask ^= 1 << i
+
+            survivors = n - (high_lost + low_lost)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fidelity = np.where(survivors >= 2, np.abs(high_sum + low_sums) ** 2 / survivors, 0.0)
+            bonus = np.maximum(fidelity - 0.8, 0.0)
+            probability = np.where(high_impossible + low_impossible == 0, np.exp(high_log_p + low_log_p), 0.0)
+
+            total_p += probability.sum()
+            expected_bonus += np.dot(probability, bonus)
+            expected_fidelity += np.dot(probability, fidelity)
+            histogram += np.bincount(np.minimum((bonus / 0.2 * bins).astype(np.int64), bins - 1),
+                                     weights=probability, minlength=bins)
+
+            candidates = probability > 0
+            if max_lost is not None:
+                candidates &= (high_lost + low_lost) <= max_lost
+            if candidates.any():
+                idx = np.flatnonzero(candidates)[np.argmin(bonus[candidates])]
+                if bonus[idx] < worst_bonus:
+                    worst_bonus, worst_mask = float(bonus[idx]), int(high_mask | low_masks[idx])
+
+    return total_p, expected_bonus, expected_fidelity, histogram, worst_bonus, worst_mask
+
+
+def coalition_loss_distribution(amplitudes, loss_probabilities, max_lost=None, workers=1, low_bits=16, bins=20):
+    """
+    Expected and worst-case W-state robustness bonus over every coalition of lost stakeholders.
+
+    amplitudes: W-state amplitudes (a SparseWState or array); loss_probabilities: per-stakeholder
+    independent loss probability (scalar or array). Worst case is taken over coalitions with
+    non-zero probability and at most `max_lost` losses. Returns a dict with expected_bonus,
+    expected_fidelity, worst_bonus, worst_lost (stakeholder indices), bonus_histogram
+    (probability mass per bin of [0, 0.2]) and the enumerated coalition count.
+    """
+    if isinstance(amplitudes, SparseWState):
+        amplitudes = amplitudes.amplitudes
+    amplitudes = SparseWState(amplitudes).amplitudes
+    n = len(amplitudes)
+    if n > MAX_STAKEHOLDERS:
+        raise ValueError(f"Coalition enumeration is 2^N; N={n} exceeds {MAX_STAKEHOLDERS}")
+    loss_probabilities = np.broadcast_to(np.asarray(loss_probabilities, dtype=np.float64), (n,)).copy()
+
+    low_bits = min(low_bits, n)
+    prefix_bits = min(max(int(np.ceil(np.log2(workers))), 0) if workers > 1 else 0, n - low_bits)
+    middle_bits = n - low_bits - prefix_bits
+    prefixes = np.array_split(np.arange(1 << prefix_bits), max(1, min(workers, 1 << prefix_bits)))
+    tasks = [(amplitudes, loss_probabilities, low_bits, middle_bits, [int(p) for p in chunk], max_lost, bins)
+             for chunk in prefixes]
+
+    if len(tasks) == 1:
+        partials = [_enumerate_prefix(*tasks[0])]
+    else:
+        enumerate_prefix = functools.partial(metrics.call_collecting, metrics.enabled(), _enumerate_prefix)
+        partials = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial, worker_metrics in pool.map(enumerate_prefix, *zip(*tasks)):
+                metrics.merge(worker_metrics)
+                partials.append(partial)
+
+    total_p = sum(p[0] for p in partials)
+    worst_bonus, worst_mask = min(((p[4], p[5]) for p in partials), key=lambda item: item[0])
+    return {
+        "num_stakeholders": n,
+        "num_coalitions": 1 << n,
+        "probability_mass": total_p,
+        "expected_bonus": sum(p[1] for p in partials) / total_p,
+        "expected_fidelity": sum(p[2] for p in partials) / total_p,
+        "worst_bonus": worst_bonus if worst_mask >= 0 else None,
+        "worst_lost": [i for i in range(n) if worst_mask >= 0 and (worst_mask >> i) & 1],
+        "bonus_histogram": sum(p[3] for p in partials) / total_p,
+        "bonus_bin_edges": np.linspace(0.0, 0.2, bins + 1),
+    }
@@ -0,0 +1,182 @@
+import abc
+import functools
+
+from pemev11.batch import evaluate_paths, format_evaluations
+from pemev11.wstate import classical_w_state_bonus, w_state_bonus
+
+# One engine for all script variants. Stages do no array work themselves: each folds its
+# constants into the parameters of a single evaluate_paths kernel, so a full
+# clamp + weighted sum + bonus + remorse + guidance pipeline is one pass over the data.
+
+
+class Stage(abc.ABC):
+    """A composable scoring stage; configure() folds its constants into the kernel parameters."""
+
+    @abc.abstractmethod
+    def configure(self, params):
+        """Fold this stage's constants into the evaluate_paths parameters (mutates `params`)."""
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class Clamp(Stage):
+    """min(k_progress, upper): energy progress stops counting at Type I."""
+
+    def __init__(self, upper=1.0):
+        self.upper = upper
+
+    def configure(self, params):
+        params["k_progress_cap"] = self.upper
+
+
+class WeightedSum(Stage):
+    """Weighted energy/equity/sustainability score against today's power."""
+
+    def __init__(self, weights=(0.3, 0.4, 0.3), current_power_watts=2.3e13):
+        self.weights = tuple(weights)
+        self.current_power_watts = current_power_watts
+
+    def configure(self, params):
+        params["weights"] = self.weights
+        params["current_power_watts"] = self.current_power_watts
+
+
+class RealDataHints(Stage):
+    """Defaults for paths without equity/sustainability scores (real-world ~2025 hints)."""
+
+    def __init__(self, equity=0.35, sustainability=0.65):
+        self.equity = equity
+        self.sustainability = sustainability
+
+    def configure(self, params):
+        params["default_equity"] = self.equity
+        params["default_sustainability"] = self.sustainability
+
+
+class FixedBonus(Stage):
+    """Constant robustness bonus (full_visual / visualization scripts use 0.20)."""
+
+    def __init__(self, bonus=0.20):
+        self.bonus = bonus
+
+    def configure(self, params):
+        params["robustness_bonus"] += self.bonus
+
+
+class WStateBonus(Stage):
+    """
+    W-state robustness bonus for the stakeholder groups (sparse W-state model);
+    classical=True reproduces the original hint, which is always 0.20.
+    """
+
+    def __init__(self, num_stakeholders=3, stakeholder_weights=None, loss_probabilities=None, classical=False):
+        self.num_stakeholders = num_stakeholders
+        self.stakeholder_weights = stakeholder_weights
+        self.loss_probabilities = loss_probabilities
+        self.classical = classical
+
+    def configure(self, params):
+        if self.classical:
+            params["robustness_bonus"] += classical_w_state_bonus(self.num_stakeholders)
+        else:
+            params["robustness_bonus"] += w_state_bonus(self.num_stakeholders, self.stakeholder_weights,
+                                                        self.loss_probabilities)
+
+
+class RemorseHorizon(Stage):
+    """Vector 10 link: remorse_horizon = base + (1 - ethical_score)."""
+
+    def __init__(self, base_remorse_horizon=-1.00):
+        self.base_remorse_horizon = base_remorse_horizon
+
+    def configure(self, params):
+        params["base_remorse_horizon"] = self.base_remorse_horizon
+
+
+class Threshold(Stage):
+    """RECOMMEND when ethical_score >= threshold."""
+
+    def __init__(self, ethical_threshold=0.95):
+        self.ethical_threshold = ethical_threshold
+
+    def configure(self, params):
+        params["ethical_threshold"] = self.ethical_threshold
+
+
+class ScoringEngine:
+    """
+    Composition of stages compiled to one fused evaluate_paths call.
+    Stages apply in order, so later ones override earlier settings (bonuses add up).
+    """
+
+    def __init__(self, *stages):
+        self.stages = stages
+        params = {
+            "current_power_watts": 2.3e13,
+            "weights": (0.3, 0.4, 0.3),
+            "ethical_threshold": 0.95,
+            "base_remorse_horizon": None,
+            "robustness_bonus": 0.0,
+            "k_progress_cap": None,
+            "default_equity": 0.8,
+            "default_sustainability": 0.8,
+        }
+        for stage in stages:
+            stage.configure(params)
+        self.default_equity = params.pop("default_equity")
+        self.default_sustainability = params.pop("default_sustainability")
+        self.params = params
+        self.kernel = functools.partial(evaluate_paths, **params)
+
+    def __repr__(self):
+        return f"ScoringEngine({', '.join(map(repr, self.stages))})"
+
+    def then(self, *stages):
+        """New engine with extra stages appended."""
+        return ScoringEngine(*self.stages, *stages)
+
+    def evaluate(self, growth_factor, years, equity_score=None, sustainability_score=None, verbose=False):
+        if equity_score is None:
+            equity_score = self.default_equity
+        if sustainability_score is None:
+            sustainability_score = self.default_sustainability
+        results = self.kernel(growth_factor, years, equity_score, sustainability_score)
+        if verbose:
+            print(format_evaluations(results, self.params["ethical_threshold"]))
+        return results
+
+    @classmethod
+    def from_vector(cls, vector):
+        """Engine equivalent to a PlanetaryEnergyMasteryEthicalVector's own scoring."""
+        return cls(
+            Clamp(),
+            WeightedSum((vector.weight_energy, vector.weight_equity, vector.weight_sustainability),
+                        vector.current_power_watts),
+            RealDataHints(vector.current_equity, vector.current_sustainability),
+            WStateBonus(vector.num_stakeholders, vector.stakeholder_weights,
+                        vector.stakeholder_loss_probabilities),
+            RemorseHorizon(vector.base_remorse_horizon),
+            Threshold(vector.ethical_threshold),
+        )
+
+
+# The historical scripts as stage pipelines
+PRESETS = {
+    "simple_ethical": (Clamp(), WeightedSum(), Threshold()),
+    "remorse_link": (Clamp(), WeightedSum(), RemorseHorizon(), Threshold()),
+    "real_data_hint": (Clamp(), WeightedSum(), RealDataHints(), RemorseHorizon(), Threshold()),
+    "current_reject": (Clamp(), WeightedSum(), RemorseHorizon(), Threshold()),
+    "wstate_hint": (Clamp(), WeightedSum(), RealDataHints(), WStateBonus(classical=True), RemorseHorizon(),
+                    Threshold()),
+    "full_visual": (Clamp(), WeightedSum(), RealDataHints(), FixedBonus(0.20), RemorseHorizon(), Threshold()),
+}
+
+
+def preset_engine(name):
+    """ScoringEngine reproducing one of the pemev11_*.py script variants."""
+    try:
+        return ScoringEngine(*PRESETS[name])
+    except KeyError:
+        raise ValueError(f"Unknown preset {name!r} (expected one of {', '.join(PRESETS)})") from None
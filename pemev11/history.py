@@ -0,0 +1,197 @@
+import csv
+import json
+import os
+
+import numpy as np
+
+HISTORY_DTYPE = np.dtype([
+    ("year", "i4"),
+    ("region", "i4"),  # code into HistoricalDataset.region_names
+    ("power_watts", "f8"),
+    ("equity", "f8"),
+    ("sustainability", "f8"),
+    ("population", "f8"),  # NaN when the source has no population column
+])
+COLUMNS = HISTORY_DTYPE.names
+
+CSV_ALIASES = {
+    "country": "region",
+    "power": "power_watts",
+    "equity_score": "equity",
+    "sustainability_score": "sustainability",
+}
+
+
+class HistoricalDataset:
+    """
+    Per-region yearly power / equity / sustainability series stored column by column as
+    memory-mapped .npy files, rows sorted by (year, region).
+
+    Layout of the dataset directory:
+      meta.json            row count, region names, whether population is present
+      <column>.npy         one file per HISTORY_DTYPE column
+      years.npy            distinct years
+      year_offsets.npy     rows of years[i] are [year_offsets[i], year_offsets[i + 1])
+      region_rows.npy      row numbers grouped by region (years ascending within a region)
+      region_offsets.npy   rows of region r are region_rows[region_offsets[r]:region_offsets[r + 1]]
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.region_names = np.array(self.meta["regions"])
+        self._codes = {name: code for code, name in enumerate(self.meta["regions"])}
+        self.columns = {name: self._open(name) for name in COLUMNS}
+        self.years = np.load(os.path.join(path, "years.npy"))
+        self.year_offsets = np.load(os.path.join(path, "year_offsets.npy"))
+        self.region_offsets = np.load(os.path.join(path, "region_offsets.npy"))
+        self.region_rows = self._open("region_rows")
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    @property
+    def has_population(self):
+        return self.meta["has_population"]
+
+    @classmethod
+    def create(cls, path, records, region_names):
+        """Write a dataset from HISTORY_DTYPE records (any order) and the names behind their region codes."""
+        records = np.asarray(records, dtype=HISTORY_DTYPE)
+        records = records[np.lexsort((records["region"], records["year"]))]
+        if len(records) > 1:
+            same = ((records["year"][1:] == records["year"][:-1])
+                    & (records["region"][1:] == records["region"][:-1]))
+            if same.any():
+                i = int(np.argmax(same))
+                raise ValueError(f"Duplicate row for region {region_names[records['region'][i]]!r}, "
+                                 f"year {records['year'][i]}")
+
+        os.makedirs(path, exist_ok=True)
+        for name in COLUMNS:
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(records[name]))
+        years, year_starts = np.unique(records["year"], return_index=True)
+        np.save(os.path.join(path, "years.npy"), years)
+        np.save(os.path.join(path, "year_offsets.npy"), np.append(year_starts, len(records)).astype(np.int64))
+        region_rows = np.argsort(records["region"], kind="stable").astype(np.int64)
+        counts = np.bincount(records["region"], minlength=len(region_names))
+        np.save(os.path.join(path, "region_rows.npy"), region_rows)
+        np.save(os.path.join(path, "region_offsets.npy"), np.r_[0, np.cumsum(counts)].astype(np.int64))
+
+        meta = {
+            "rows": len(records),
+            "regions": [str(name) for name in region_names],
+            "has_population": bool(not np.isnan(records["population"]).all()) if len(records) else False,
+        }
+        # meta.json last: its presence marks a complete dataset
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        return cls(path)
+
+    def region_code(self, name):
+        try:
+            return self._codes[name]
+        except KeyError:
+            raise KeyError(f"Unknown region {name!r}") from None
+
+    def year_rows(self, start=None, stop=None):
+        """Row range [lo, hi) covering years start..stop inclusive (None = open-ended)."""
+        lo = 0 if start is None else np.searchsorted(self.years, start, side="left")
+        hi = len(self.years) if stop is None else np.searchsorted(self.years, stop, side="right")
+        return int(self.year_offsets[lo]), int(self.year_offsets[hi])
+
+    def rows(self, years=None, regions=None):
+        """
+        Row numbers (ascending) for a year (int), an inclusive (start, stop) year range or None
+        for all years, restricted to the given region names/codes (None = all regions).
+        Costs O(log) index lookups plus the size of the answer.
+        """
+        if years is None:
+            lo, hi = 0, len(self)
+        elif np.isscalar(years):
+            lo, hi = self.year_rows(years, years)
+        else:
+            lo, hi = self.year_rows(*years)
+        if regions is None:
+            return np.arange(lo, hi)
+
+        if isinstance(regions, (str, int, np.integer)):
+            regions = [regions]
+        parts = []
+        for region in regions:
+            code = self.region_code(region) if isinstance(region, str) else int(region)
+            group = self.region_rows[self.region_offsets[code]:self.region_offsets[code + 1]]
+            # A region's rows ascend with year, so the year range is one contiguous run
+            parts.append(group[np.searchsorted(group, lo):np.searchsorted(group, hi)])
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+    def select(self, years=None, regions=None):
+        """HISTORY_DTYPE records for a year / year range and region subset (see rows())."""
+        rows = self.rows(years, regions)
+        out = np.empty(len(rows), dtype=HISTORY_DTYPE)
+        contiguous = len(rows) and rows[-1] - rows[0] + 1 == len(rows)
+        for name, column in self.columns.items():
+            out[name] = column[rows[0]:rows[-1] + 1] if contiguous else column[rows]
+        return out
+
+    def snapshot(self, year, regions=None):
+        """
+        Planet (or region subset) state in one year: total power, and equity / sustainability
+        averaged with population weights (plain mean when the data has no population at all).
+        """
+        records = self.select(year, regions)
+        if not len(records):
+            raise KeyError(f"No historical data for year {year}")
+        weights = population_weights(records, self.region_names)
+        return {
+            "year": int(year),
+            "power_watts": float(records["power_watts"].sum()),
+            "equity": float(np.average(records["equity"], weights=weights)),
+            "sustainability": float(np.average(records["sustainability"], weights=weights)),
+        }
+
+    def _open(self, name):
+        return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+
+
+def population_weights(records, region_names=None):
+    """
+    Population column of HISTORY_DTYPE records for weighting: None when no record has a
+    population, ValueError naming the regions when only some do (no silent unweighted mean).
+    """
+    population = records["population"]
+    missing = np.isnan(population)
+    if missing.all():
+        return None
+    if missing.any():
+        codes = np.unique(records["region"][missing])
+        names = [str(region_names[code]) for code in codes] if region_names is not None else codes.tolist()
+        raise ValueError(f"Population missing for region(s) {', '.join(map(str, names))}; "
+                         f"cannot population-weight")
+    return population
+
+
+def convert_csv(csv_path, path):
+    """
+    Convert a raw CSV (header: year, region/country, power_watts/power, equity, sustainability,
+    optional population) into a HistoricalDataset directory. Region codes follow sorted names.
+    """
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        header = [CSV_ALIASES.get(name.strip().lower(), name.strip().lower()) for name in next(reader)]
+        missing = [name for name in COLUMNS[:-1] if name not in header]
+        if missing:
+            raise ValueError(f"History CSV is missing column(s): {', '.join(missing)}")
+        index = {name: header.index(name) for name in COLUMNS if name in header}
+        rows = [row for row in reader if row]
+
+    region_names, region_codes = np.unique([row[index["region"]].strip() for row in rows], return_inverse=True)
+    records = np.empty(len(rows), dtype=HISTORY_DTYPE)
+    records["region"] = region_codes.ravel()
+    for name in ("year", "power_watts", "equity", "sustainability", "population"):
+        if name in index:
+            records[name] = np.array([row[index[name]] or "nan" for row in rows], dtype=np.float64)
+        else:
+            records[name] = np.nan
+    return HistoricalDataset.create(path, records, region_names)
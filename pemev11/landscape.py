@@ -0,0 +1,168 @@
+import json
+import os
+
+import numpy as np
+
+from pemev11.batch import kardashev_progress
+
+AXES = ("growth_factor", "equity", "sustainability")
+FIELDS = ("ethical_score", "remorse_horizon")
+
+
+class LandscapeGrid:
+    """
+    Full (growth x equity x sustainability) ethical landscape stored as memory-mapped .npy files.
+
+    Layout of the grid directory:
+      meta.json                 model parameters, shape, dtype, tile size
+      axes.npz                  the three axis coordinate arrays
+      ethical_score.npy         score cube, written tile by tile along the growth axis
+      remorse_horizon.npy       remorse horizon cube
+      tiles_done.npy            per-tile completion flags (resume support)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        with np.load(os.path.join(path, "axes.npz")) as axes:
+            self.axes = {name: axes[name] for name in AXES}
+        self.shape = tuple(self.meta["shape"])
+        self.tile_size = self.meta["tile_size"]
+
+    @classmethod
+    def create(cls, path, growth_factors, equity_scores, sustainability_scores, current_power_watts=2.3e13,
+               weights=(0.3, 0.4, 0.3), base_remorse_horizon=-1.00, robustness_bonus=0.0,
+               dtype="float32", tile_size=64):
+        """Allocate an empty grid on disk (no scores computed yet)."""
+        axes = {
+            "growth_factor": np.asarray(growth_factors, dtype=np.float64),
+            "equity": np.asarray(equity_scores, dtype=np.float64),
+            "sustainability": np.asarray(sustainability_scores, dtype=np.float64),
+        }
+        shape = tuple(len(axes[name]) for name in AXES)
+        meta = {
+            "shape": shape,
+            "dtype": np.dtype(dtype).str,
+            "tile_size": tile_size,
+            "current_power_watts": current_power_watts,
+            "weights": list(weights),
+            "base_remorse_horizon": base_remorse_horizon,
+            "robustness_bonus": robustness_bonus,
+        }
+
+        os.makedirs(path, exist_ok=True)
+        np.savez(os.path.join(path, "axes.npz"), **axes)
+        for field in FIELDS:
+            np.lib.format.open_memmap(os.path.join(path, f"{field}.npy"), mode="w+",
+                                      dtype=dtype, shape=shape).flush()
+        num_tiles = -(-shape[0] // tile_size)
+        np.save(os.path.join(path, "tiles_done.npy"), np.zeros(num_tiles, dtype=bool))
+        # meta.json last: its presence marks a fully allocated grid
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        return cls(path)
+
+    @property
+    def tiles_done(self):
+        return np.load(os.path.join(self.path, "tiles_done.npy"))
+
+    @property
+    def is_complete(self):
+        return bool(self.tiles_done.all())
+
+    def generate(self, progress=None):
+        """
+        Compute all missing tiles. Each tile is flushed to disk before it is marked done,
+        so an interrupted run resumes from the first unfinished tile.
+        """
+        weight_energy, weight_equity, weight_sustainability = self.meta["weights"]
+        equity = self.axes["equity"]
+        sustainability = self.axes["sustainability"]
+        k_progress = kardashev_progress(self.axes["growth_factor"], self.meta["current_power_watts"])
+
+        # Equity/sustainability part is the same for every growth slice
+        plane = (weight_equity * equity[:, None] + weight_sustainability * sustainability[None, :]
+                 + self.meta["robustness_bonus"])
+        remorse_offset = self.meta["base_remorse_horizon"] + 1.0
+
+        done = self.tiles_done
+        scores = self._open("ethical_score", "r+")
+        remorse = self._open("remorse_horizon", "r+")
+        for tile in np.flatnonzero(~done):
+            lo = tile * self.tile_size
+            hi = min(lo + self.tile_size, self.shape[0])
+            block = (weight_energy * k_progress[lo:hi])[:, None, None] + plane[None, :, :]
+            scores[lo:hi] = block
+            remorse[lo:hi] = remorse_offset - block
+            scores.flush()
+            remorse.flush()
+
+            done[tile] = True
+            np.save(os.path.join(self.path, "tiles_done.npy"), done)
+            if progress is not None:
+                progress(int(done.sum()), len(done))
+        return self
+
+    def plane(self, field, axis, index):
+        """
+        2D slice of `field` at `index` along `axis` (name or number), read from the
+        memory map without loading the cube. Returns (array, (row_axis, col_axis)).
+        """
+        axis = AXES.index(axis) if isinstance(axis, str) else axis
+        cube = self._open(field, "r")
+        selector = [slice(None)] * 3
+        selector[axis] = index
+        others = tuple(name for i, name in enumerate(AXES) if i != axis)
+        return np.array(cube[tuple(selector)]), tuple(self.axes[name] for name in others)
+
+    def nearest_index(self, axis, value):
+        """Index of the axis coordinate closest to `value`."""
+        axis = AXES[axis] if isinstance(axis, int) else axis
+        return int(np.abs(self.axes[axis] - value).argmin())
+
+    def _open(self, field, mode):
+        return np.load(os.path.join(self.path, f"{field}.npy"), mmap_mode=mode)
+
+
+def build_landscape_grid(vector, path, resolution=(4096, 512, 512), growth_range=(1.0, 1e4),
+                         dtype="float32", tile_size=64, progress=None):
+    """
+    Create (or resume) the landscape grid for a vector's weights, power and bonus.
+    Growth is log-spaced over growth_range; equity and sustainability span [0, 1].
+    """
+    meta_path = os.path.join(path, "meta.json")
+    weights = [vector.weight_energy, vector.weight_equity, vector.weight_sustainability]
+    num_growth, num_equity, num_sustainability = resolution
+    growth_factors = np.logspace(np.log10(growth_range[0]), np.log10(growth_range[1]), num_growth)
+    if os.path.exists(meta_path):
+        grid = LandscapeGrid(path)
+        expected = {
+            "shape": list(resolution),
+            "dtype": np.dtype(dtype).str,
+            "tile_size": tile_size,
+            "current_power_watts": vector.current_power_watts,
+            "weights": weights,
+            "base_remorse_horizon": vector.base_remorse_horizon,
+            "robustness_bonus": vector.w_state_robustness_bonus(),
+        }
+        mismatched = [key for key, value in expected.items() if grid.meta[key] != value]
+        # growth_range is not in meta.json; the stored axis is compared instead
+        if grid.shape == tuple(resolution) and not np.allclose(grid.axes["growth_factor"], growth_factors):
+            mismatched.append("growth_range")
+        if mismatched:
+            raise ValueError(f"Existing grid at {path} was built with different {', '.join(mismatched)}")
+    else:
+        grid = LandscapeGrid.create(
+            path,
+            growth_factors,
+            np.linspace(0.0, 1.0, num_equity),
+            np.linspace(0.0, 1.0, num_sustainability),
+            current_power_watts=vector.current_power_watts,
+            weights=weights,
+            base_remorse_horizon=vector.base_remorse_horizon,
+            robustness_bonus=vector.w_state_robustness_bonus(),
+            dtype=dtype,
+            tile_size=tile_size,
+        )
+    return grid.generate(progress)
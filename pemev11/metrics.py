@@ -0,0 +1,226 @@
+import bisect
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Opt-in instrumentation: call counts, errors, latency and batch-size histograms per
+# operation. Disabled (the default) an instrumented call costs one global flag check;
+# enable with enable() or PEMEV11_METRICS=1.
+
+LATENCY_BUCKETS = tuple(float(f"{m}e{e}") for e in range(-6, 2) for m in (1, 2.5, 5))  # 1 µs .. 50 s, exact labels
+BATCH_BUCKETS = tuple(10 ** e for e in range(9))  # 1 .. 1e8 items
+
+_enabled = os.environ.get("PEMEV11_METRICS", "") not in ("", "0")
+
+
+class Histogram:
+    """Cumulative-style histogram (Prometheus semantics: bucket i counts values <= bounds[i])."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def merge(self, data):
+        """Add a snapshot() of a histogram with the same bounds."""
+        previous = 0
+        for i, cumulative in enumerate(data["cumulative_counts"]):
+            self.counts[i] += cumulative - previous
+            previous = cumulative
+        self.total += data["sum"]
+
+    def snapshot(self):
+        cumulative, running = [], 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        return {"bounds": list(self.bounds), "cumulative_counts": cumulative, "sum": self.total,
+                "count": running}
+
+
+class Operation:
+    """Counters and histograms for one instrumented operation."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.batch = Histogram(BATCH_BUCKETS)
+
+    def snapshot(self):
+        return {"calls": self.calls, "errors": self.errors, "latency_seconds": self.latency.snapshot(),
+                "batch_size": self.batch.snapshot()}
+
+
+_operations = {}
+_counters = {}
+_lock = threading.Lock()
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _operations.clear()
+        _counters.clear()
+
+
+def observe(name, seconds, batch_size=None, error=False):
+    """Record one call of operation `name` (no-op when disabled)."""
+    if not _enabled:
+        return
+    with _lock:
+        operation = _operations.get(name)
+        if operation is None:
+            operation = _operations[name] = Operation()
+        operation.calls += 1
+        operation.errors += error
+        operation.latency.observe(seconds)
+        if batch_size is not None:
+            operation.batch.observe(batch_size)
+
+
+def count(name, amount=1):
+    """Increment a plain event counter, e.g. fallbacks (no-op when disabled)."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def instrumented(name, batch_size=None):
+    """
+    Decorator timing every call of the function as operation `name`.
+    batch_size(result) -> int, if given, feeds the batch-size histogram.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                observe(name, time.perf_counter() - start, error=True)
+                raise
+            observe(name, time.perf_counter() - start, batch_size(result) if batch_size else None)
+            return result
+        return wrapper
+    return decorate
+
+
+class timed:
+    """Context manager form of instrumented() for a block of code."""
+
+    __slots__ = ("name", "batch_size", "_start")
+
+    def __init__(self, name, batch_size=None):
+        self.name = name
+        self.batch_size = batch_size
+
+    def __enter__(self):
+        self._start = time.perf_counter() if _enabled else None
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._start is not None:
+            observe(self.name, time.perf_counter() - self._start, self.batch_size, error=exc_type is not None)
+
+
+def merge(data):
+    """Add a snapshot() taken elsewhere, e.g. in a worker process, into this registry."""
+    if not _enabled or data is None:
+        return
+    with _lock:
+        for name, op in data["operations"].items():
+            operation = _operations.get(name)
+            if operation is None:
+                operation = _operations[name] = Operation()
+            operation.calls += op["calls"]
+            operation.errors += op["errors"]
+            operation.latency.merge(op["latency_seconds"])
+            operation.batch.merge(op["batch_size"])
+        for name, value in data["counters"].items():
+            _counters[name] = _counters.get(name, 0) + value
+
+
+def call_collecting(collect, func, *args):
+    """
+    Worker-side wrapper for process pools: run func(*args) with metrics on iff `collect` (the
+    parent's enabled()) and return (result, snapshot or None) for the parent to merge().
+    Metrics recorded in a child process otherwise stay in the child's registry and are lost.
+    """
+    enable(collect)
+    if not collect:
+        return func(*args), None
+    reset()  # forked children inherit the parent's registry; only report this call
+    return func(*args), snapshot()
+
+
+def snapshot():
+    """All metrics as plain JSON-compatible data."""
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "operations": {name: op.snapshot() for name, op in sorted(_operations.items())},
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def _prometheus_histogram(lines, metric, label, histogram):
+    for bound, cumulative in zip(histogram["bounds"] + ["+Inf"], histogram["cumulative_counts"]):
+        lines.append(f'{metric}_bucket{{operation="{label}",le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_sum{{operation="{label}"}} {histogram["sum"]!r}')
+    lines.append(f'{metric}_count{{operation="{label}"}} {histogram["count"]}')
+
+
+def prometheus_text(data=None):
+    """Prometheus text exposition format of a snapshot."""
+    data = snapshot() if data is None else data
+    # Each metric family must be one contiguous group of lines
+    lines = ["# TYPE pemev11_calls_total counter"]
+    for name, op in data["operations"].items():
+        lines.append(f'pemev11_calls_total{{operation="{name}"}} {op["calls"]}')
+    lines.append("# TYPE pemev11_errors_total counter")
+    for name, op in data["operations"].items():
+        lines.append(f'pemev11_errors_total{{operation="{name}"}} {op["errors"]}')
+    lines.append("# TYPE pemev11_latency_seconds histogram")
+    for name, op in data["operations"].items():
+        _prometheus_histogram(lines, "pemev11_latency_seconds", name, op["latency_seconds"])
+    lines.append("# TYPE pemev11_batch_size histogram")
+    for name, op in data["operations"].items():
+        if op["batch_size"]["count"]:
+            _prometheus_histogram(lines, "pemev11_batch_size", name, op["batch_size"])
+    lines.append("# TYPE pemev11_events_total counter")
+    for name, value in data["counters"].items():
+        lines.append(f'pemev11_events_total{{event="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def export(path):
+    """
+    Write a snapshot to `path`: JSON for *.json, Prometheus text otherwise (e.g. a node_exporter
+    textfile-collector *.prom). Written via rename so scrapers never read a partial file.
+    """
+    data = snapshot()
+    text = json.dumps(data, indent=2) if path.endswith(".json") else prometheus_text(data)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return path
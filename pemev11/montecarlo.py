@@ -0,0 +1,123 @@
+import functools
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pemev11.batch import kardashev_progress
+from pemev11 import metrics
+from pemev11.metrics import instrumented
+
+RECOMMEND_PROBABILITY_DTYPE = np.dtype([
+    ("recommend_count", "i8"),
+    ("recommend_probability", "f8"),
+    ("ci_low", "f8"),
+    ("ci_high", "f8"),
+])
+
+# Samples are drawn in blocks of this size, each from its own spawned SeedSequence; results
+# for a seed are identical for any worker count or sample_chunk
+SAMPLE_BLOCK = 4096
+
+
+def sample_weights(rng, num_samples):
+    """
+    Draw normalized (energy, equity, sustainability) weight triples, shape (3, num_samples).
+    Same distribution as seed_weights_with_quantum_randomness: three uniforms divided by their sum.
+    """
+    weights = rng.random((3, num_samples))
+    weights /= weights.sum(axis=0)
+    return weights
+
+
+def sample_block_seed(seed_seq, block):
+    """
+    SeedSequence of sample block `block`: the block-th spawn child of `seed_seq`, built from its
+    spawn key so it does not depend on how many children were spawned before.
+    """
+    return np.random.SeedSequence(seed_seq.entropy, spawn_key=tuple(seed_seq.spawn_key) + (block,),
+                                  pool_size=seed_seq.pool_size)
+
+
+def count_recommends(features, cutoff, num_samples, seed_seq, path_chunk=1024, sample_chunk=4096, blocks=None):
+    """
+    Count, per path, how many of `num_samples` weight draws give score >= cutoff.
+    features: (n, 3) array of (k_progress, equity, sustainability).
+    Draws come in SAMPLE_BLOCK blocks, block i from sample_block_seed(seed_seq, i), so the
+    counts do not depend on how blocks are split across workers (`blocks`: the block indices
+    to draw here, default all) or on `sample_chunk`, the matmul width.
+    Peak memory is one (path_chunk x sample_chunk) score block plus the counts.
+    """
+    num_blocks = -(-num_samples // SAMPLE_BLOCK)
+    sample_chunk = min(sample_chunk, SAMPLE_BLOCK)
+    counts = np.zeros(len(features), dtype=np.int64)
+    block = np.empty((path_chunk, sample_chunk))
+    for index in range(num_blocks) if blocks is None else blocks:
+        m = min(SAMPLE_BLOCK, num_samples - index * SAMPLE_BLOCK)
+        block_weights = sample_weights(np.random.default_rng(sample_block_seed(seed_seq, index)), m)
+        for lo in range(0, m, sample_chunk):
+            weights = block_weights[:, lo:lo + sample_chunk]
+            for start in range(0, len(features), path_chunk):
+                chunk = features[start:start + path_chunk]
+                scores = np.matmul(chunk, weights, out=block[:len(chunk), :weights.shape[1]])
+                counts[start:start + len(chunk)] += np.count_nonzero(scores >= cutoff, axis=1)
+    return counts
+
+
+def wilson_interval(counts, num_samples, confidence=0.95):
+    """Wilson score interval for binomial proportions (well-behaved near 0 and 1)."""
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = counts / num_samples
+    denom = 1 + z ** 2 / num_samples
+    centre = (p + z ** 2 / (2 * num_samples)) / denom
+    half = z * np.sqrt(p * (1 - p) / num_samples + z ** 2 / (4 * num_samples ** 2)) / denom
+    return np.clip(centre - half, 0.0, 1.0), np.clip(centre + half, 0.0, 1.0)
+
+
+@instrumented("recommend_probability", batch_size=np.size)
+def recommend_probability(growth_factor, equity_score, sustainability_score, num_samples=1_000_000,
+                          current_power_watts=2.3e13, ethical_threshold=0.95, robustness_bonus=0.0,
+                          seed=None, workers=1, confidence=0.95, path_chunk=1024, sample_chunk=4096):
+    """
+    Probability that each path is RECOMMENDED across the random weight distribution.
+    Samples are drawn in SAMPLE_BLOCK blocks with independent spawned SeedSequence streams and
+    the blocks split across `workers` processes, so a seed gives the same counts for any
+    `workers` / `sample_chunk`. Returns a record array of RECOMMEND_PROBABILITY_DTYPE with a
+    Wilson confidence interval.
+    """
+    growth_factor, equity_score, sustainability_score = np.broadcast_arrays(
+        np.asarray(growth_factor, dtype=np.float64),
+        np.asarray(equity_score, dtype=np.float64),
+        np.asarray(sustainability_score, dtype=np.float64),
+    )
+    shape = growth_factor.shape
+    features = np.column_stack([
+        kardashev_progress(growth_factor, current_power_watts).ravel(),
+        equity_score.ravel(),
+        sustainability_score.ravel(),
+    ])
+    cutoff = ethical_threshold - robustness_bonus
+
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    num_blocks = -(-num_samples // SAMPLE_BLOCK)
+    workers = max(1, min(workers, num_blocks))
+
+    if workers == 1:
+        counts = count_recommends(features, cutoff, num_samples, seed_seq, path_chunk, sample_chunk)
+    else:
+        count = functools.partial(metrics.call_collecting, metrics.enabled(), count_recommends)
+        counts = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(count, features, cutoff, num_samples, seed_seq, path_chunk, sample_chunk,
+                                   range(num_blocks)[i::workers])
+                       for i in range(workers)]
+            for future in futures:
+                worker_counts, worker_metrics = future.result()
+                metrics.merge(worker_metrics)
+                counts = counts + worker_counts
+
+    out = np.empty(len(features), dtype=RECOMMEND_PROBABILITY_DTYPE)
+    out["recommend_count"] = counts
+    out["recommend_probability"] = counts / num_samples
+    out["ci_low"], out["ci_high"] = wilson_interval(counts, num_samples, confidence)
+    return out.reshape(shape)
@@ -0,0 +1,185 @@
+import numpy as np
+
+from pemev11.batch import EVALUATION_DTYPE
+
+# Non-dominated (Pareto / skyline) subsets of evaluated paths.
+#
+# Every objective is turned into "larger is better" and rows are sorted lexicographically
+# best-first, so a row can only be dominated by rows before it. Exact duplicates share one
+# verdict. Two objectives are a running-maximum sweep, three a merge-based divide and conquer
+# (O(n log n), see _skyline_3d), and four or more use sort-filter-skyline: rows ordered by
+# coordinate sum, compared block-wise against the frontier found so far.
+
+# future Kardashev level, equity, sustainability up; remorse horizon down
+PARETO_OBJECTIVES = (("future_k", "max"), ("equity", "max"), ("sustainability", "max"),
+                     ("remorse_horizon", "min"))
+
+
+def objective_matrix(results, objectives=PARETO_OBJECTIVES):
+    """(n, d) float matrix of the objectives with every column oriented so that larger is better."""
+    columns = []
+    for name, sense in objectives:
+        if sense not in ("max", "min"):
+            raise ValueError(f"Objective sense must be 'max' or 'min', got {sense!r}")
+        column = np.asarray(results[name], dtype=np.float64)
+        columns.append(column if sense == "max" else -column)
+    points = np.column_stack(columns) if columns else np.empty((len(results), 0))
+    if np.isnan(points).any():
+        raise ValueError("Objectives contain NaN (remorse_horizon needs base_remorse_horizon set)")
+    return points
+
+
+def _skyline_2d(points):
+    best_second = np.maximum.accumulate(points[:, 1])
+    return np.r_[True, points[1:, 1] > best_second[:-1]]
+
+
+def _skyline_3d(points):
+    # Row i is dominated iff an earlier row j has second_j >= second_i and third_j >= third_i.
+    # Answered for all rows at once by a bottom-up divide and conquer over positions: at each
+    # level every left half is merged with its right half in descending `second` order (left
+    # first on ties), so a running maximum of the left halves' `third` is exactly the best
+    # earlier candidate for each right-half row. Merging already-sorted runs keeps each level
+    # linear, O(n log n) overall.
+    n = len(points)
+    second = np.unique(points[:, 1], return_inverse=True)[1].ravel()
+    third = np.unique(points[:, 2], return_inverse=True)[1].ravel()
+    span_second, span_third = second.max() + 1, third.max() + 2
+    dominated = np.zeros(n, dtype=bool)
+    merged = np.arange(n)
+    half = 1
+    while half < n:
+        segment = merged // (2 * half)
+        merged = merged[np.argsort(segment * span_second - second[merged], kind="stable")]
+        segment = merged // (2 * half)
+        is_left = (merged // half) % 2 == 0
+        offset = segment * span_third
+        best = np.maximum.accumulate(offset + np.where(is_left, third[merged], -1) + 1) - offset - 1
+        dominated[merged[~is_left & (best >= third[merged])]] = True
+        half *= 2
+    return ~dominated
+
+
+def _dominated_by(points, window, first_chunk=32):
+    """Rows of `points` weakly dominated by some row of `window` (rows assumed distinct)."""
+    # Early (high-sum) window rows eliminate most points, so start with a small chunk and
+    # double it, comparing only the still-undecided points each time
+    alive = np.ones(len(points), dtype=bool)
+    start, size = 0, first_chunk
+    while start < len(window):
+        idx = np.flatnonzero(alive)
+        if not len(idx):
+            break
+        w, p = window[start:start + size], points[idx]
+        dominated = w[None, :, 0] >= p[:, None, 0]
+        for j in range(1, points.shape[1]):
+            dominated &= w[None, :, j] >= p[:, None, j]
+        alive[idx[dominated.any(axis=1)]] = False
+        start, size = start + size, size * 2
+    return ~alive
+
+
+def _skyline_sfs(points, block_size=1024):
+    # A dominating row has a strictly larger sum, so in sum order only earlier rows can dominate
+    order = np.argsort(-points.sum(axis=1), kind="stable")
+    ordered = points[order]
+    keep = np.zeros(len(points), dtype=bool)
+    window = np.empty((0, points.shape[1]))
+    for start in range(0, len(ordered), block_size):
+        block = ordered[start:start + block_size]
+        survivors = np.flatnonzero(~_dominated_by(block, window))
+        candidates = block[survivors]
+        # Within the block: q == p only on the diagonal, which must not count
+        pairwise = candidates[None, :, 0] >= candidates[:, None, 0]
+        for j in range(1, points.shape[1]):
+            pairwise &= candidates[None, :, j] >= candidates[:, None, j]
+        np.fill_diagonal(pairwise, False)
+        survivors = survivors[~pairwise.any(axis=1)]
+        keep[order[start + survivors]] = True
+        window = np.concatenate([window, block[survivors]])
+    return keep
+
+
+def pareto_mask(points):
+    """
+    Boolean mask of the non-dominated rows of `points` (n, d), every column maximized.
+    Row p is dominated when some row q is >= p everywhere and > p somewhere; identical rows
+    do not dominate each other.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n, d = points.shape
+    mask = np.zeros(n, dtype=bool)
+    if n == 0 or d == 0:
+        mask[:] = n > 0
+        return mask
+
+    order = np.lexsort(tuple(-points[:, j] for j in reversed(range(d))))  # best-first
+    ordered = points[order]
+    first = np.ones(n, dtype=bool)
+    first[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    unique = ordered[first]
+
+    if d == 1:
+        keep = np.zeros(len(unique), dtype=bool)
+        keep[0] = True
+    elif d == 2:
+        keep = _skyline_2d(unique)
+    elif d == 3:
+        keep = _skyline_3d(unique)
+    else:
+        keep = _skyline_sfs(unique)
+    mask[order] = keep[np.cumsum(first) - 1]
+    return mask
+
+
+def pareto_frontier(results, objectives=PARETO_OBJECTIVES):
+    """Non-dominated paths of an evaluate_paths record array, best first objective first."""
+    points = objective_matrix(results, objectives)
+    frontier = results[pareto_mask(points)]
+    if objectives:
+        first = frontier[objectives[0][0]]
+        frontier = frontier[np.argsort(-first if objectives[0][1] == "max" else first, kind="stable")]
+    return frontier
+
+
+def iter_pareto_frontier(chunks, objectives=PARETO_OBJECTIVES, chunk_size=65536):
+    """
+    Streaming frontier: consume record-array chunks (e.g. evaluate_paths over read_csv_chunks or
+    iter_trajectories) keeping only the running frontier in memory, then yield the final
+    frontier in chunks of `chunk_size` rows.
+    """
+    frontier = None
+    for chunk in chunks:
+        merged = chunk if frontier is None else np.concatenate([frontier, chunk])
+        frontier = merged[pareto_mask(objective_matrix(merged, objectives))]
+    if frontier is None:
+        return
+    frontier = pareto_frontier(frontier, objectives)
+    for start in range(0, len(frontier), chunk_size):
+        yield frontier[start:start + chunk_size]
+
+
+def frontier_file(input_path, output_path, vector=None, chunk_rows=1_000_000,
+                  objectives=PARETO_OBJECTIVES):
+    """
+    Pareto frontier of the scenarios in a CSV or .npy file (see stream.evaluate_file), written
+    to .npy or .csv. Only one input chunk plus the running frontier is held in memory.
+    Returns the number of frontier rows written.
+    """
+    from pemev11.stream import CsvStreamWriter, NpyStreamWriter, read_csv_chunks, read_npy_chunks
+
+    if vector is None:
+        from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+        vector = PlanetaryEnergyMasteryEthicalVector()
+    reader = read_npy_chunks if input_path.endswith(".npy") else read_csv_chunks
+    scored = (vector.evaluate_paths_ethical(columns["growth_factor"], columns["years"],
+                                            columns.get("equity"), columns.get("sustainability"))
+              for columns in reader(input_path, chunk_rows))
+
+    writer = (NpyStreamWriter if output_path.endswith(".npy") else CsvStreamWriter)(output_path, EVALUATION_DTYPE)
+    try:
+        for frontier in iter_pareto_frontier(scored, objectives):
+            writer.write(frontier)
+    finally:
+        writer.close()
+    return writer.rows
@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+
+from pemev11 import metrics
+
+QDAY_URL = "https://qday.dev/v1/bytes"
+USER_AGENT = "PEMEV11-QAI-Project-Marussa"  # polite + identifiable
+
+
+@metrics.instrumented("qday_fetch", batch_size=len)
+def fetch_quantum_random_bytes(num_bytes: int = 32, timeout: float = 10) -> bytes:
+    """Fetch true quantum random bytes from QDay API with validation."""
+    import requests  # lazy: only paid when quantum seeding is actually used
+
+    params = {"length": num_bytes}
+    headers = {"User-Agent": USER_AGENT}
+
+    try:
+        url = os.environ.get("PEMEV11_QDAY_URL", QDAY_URL)
+        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return parse_hex_bytes(response.text, num_bytes)
+
+    except Exception as e:
+        metrics.count("qday_fetch_failures")
+        print(f"QDay fetch failed: {e} → using fallback")
+        return b""
+
+
+def parse_hex_bytes(text: str, num_bytes: int) -> bytes:
+    """Validate a QDay hex response and decode it."""
+    hex_string = text.strip()
+    if len(hex_string) != num_bytes * 2 or not all(c in "0123456789abcdefABCDEF" for c in hex_string):
+        raise ValueError("Invalid hex response from QDay")
+    return bytes.fromhex(hex_string)
+
+
+class QDayEntropyPool:
+    """
+    Prefetching pool of QDay quantum random bytes.
+
+    Large blocks are fetched over one keep-alive session on a background thread and
+    small seed requests (24 bytes) are served from memory. Repeated failures open a
+    circuit breaker so callers fall back to os.urandom immediately instead of waiting
+    on network timeouts; after `reset_after` seconds one trial fetch is allowed again.
+    """
+
+    def __init__(self, url=None, block_size=1024, low_water=256, timeout=2.0,
+                 failure_threshold=3, reset_after=30.0):
+        self.url = url or os.environ.get("PEMEV11_QDAY_URL", QDAY_URL)
+        self.block_size = block_size
+        self.low_water = low_water
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+
+        self._buffer = bytearray()
+        self._cond = threading.Condition()
+        self._refilling = False
+        self._failures = 0
+        self._open_until = 0.0
+        self._session = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def available(self):
+        return len(self._buffer)
+
+    @property
+    def circuit_open(self):
+        return time.monotonic() < self._open_until
+
+    def take(self, num_bytes: int = 24, wait: float = None) -> bytes:
+        """
+        Serve `num_bytes` from the pool, triggering a background refill below low water.
+        Waits up to `wait` seconds (default: the fetch timeout) for a pending refill;
+        returns b"" when no quantum bytes are available so the caller can fall back.
+        """
+        wait = self.timeout if wait is None else wait
+        deadline = time.monotonic() + wait
+        with self._cond:
+            while len(self._buffer) < num_bytes:
+                if not self._refilling and not self._start_refill():
+                    return b""  # circuit open or closed pool: fail fast
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return b""
+                self._cond.wait(remaining)
+
+            data = bytes(self._buffer[:num_bytes])
+            del self._buffer[:num_bytes]
+            if len(self._buffer) < self.low_water and not self._refilling:
+                self._start_refill()
+            return data
+
+    def prefetch(self):
+        """Start filling the pool ahead of the first seed request."""
+        with self._cond:
+            if not self._refilling and len(self._buffer) < self.low_water:
+                self._start_refill()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _start_refill(self):
+        # Caller holds self._cond
+        if self._closed or self.circuit_open:
+            return False
+        self._refilling = True
+        threading.Thread(target=self._refill, name="qday-refill", daemon=True).start()
+        return True
+
+    def _refill(self):
+        try:
+            block = self._fetch_block(self.block_size)
+        except Exception as e:
+            block = None
+            error = e
+        with self._cond:
+            self._refilling = False
+            if block is not None:
+                self._buffer += block
+                self._failures = 0
+            else:
+                self._failures += 1
+                metrics.count("qday_fetch_failures")
+                if self._failures >= self.failure_threshold:
+                    self._open_until = time.monotonic() + self.reset_after
+                    metrics.count("qday_circuit_open")
+                    print(f"QDay fetch failed {self._failures}x: {error} → circuit open for {self.reset_after:.0f}s")
+                    self._failures = 0
+            self._cond.notify_all()
+
+    @metrics.instrumented("qday_fetch_block", batch_size=len)
+    def _fetch_block(self, num_bytes):
+        if self._session is None:
+            import requests  # lazy: only paid when quantum seeding is actually used
+            self._session = requests.Session()
+            self._session.headers["User-Agent"] = USER_AGENT
+        response = self._session.get(self.url, params={"length": num_bytes}, timeout=self.timeout)
+        response.raise_for_status()
+        return parse_hex_bytes(response.text, num_bytes)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> QDayEntropyPool:
+    """Process-wide pool shared by all vectors."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = QDayEntropyPool()
+        return _default_pool
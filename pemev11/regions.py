@@ -0,0 +1,91 @@
+import numpy as np
+
+from pemev11.batch import EVALUATION_DTYPE, evaluate_paths
+
+# Region-disaggregated scenarios scored at the planetary level.
+#
+# Input is flat: one row per (scenario, region) with the region's current power, growth,
+# equity, sustainability and population. Scenario ids are mapped to dense codes once and each
+# scenario is reduced with weighted bincounts (segment sums, no per-region loop): Kardashev
+# level from the summed future power (not an average of regional K), equity and
+# sustainability weighted by population.
+# The aggregates then go through evaluate_paths once, giving global score and guidance.
+
+REGIONAL_DTYPE = np.dtype([
+    ("scenario", "i8"),
+    ("num_regions", "i8"),
+    ("power_watts", "f8"),
+    ("future_power_watts", "f8"),
+    ("population", "f8"),
+] + [(name, EVALUATION_DTYPE[name]) for name in EVALUATION_DTYPE.names])
+
+
+def evaluate_regions(scenario, power_watts, growth_factor, years, equity_score, sustainability_score,
+                     population=1.0, weights=(0.3, 0.4, 0.3), ethical_threshold=0.95,
+                     base_remorse_horizon=-1.00, robustness_bonus=0.0, k_progress_cap=1.0):
+    """
+    Global evaluation of region-level scenario rows grouped by `scenario` (any integer ids, any
+    order). Per scenario: power and population are summed, growth_factor is the ratio of total
+    future to total current power, equity/sustainability are population-weighted means and
+    years the mean horizon of its rows. Returns REGIONAL_DTYPE, one row per scenario id (sorted).
+    """
+    scenario, power_watts, growth_factor, years, equity_score, sustainability_score, population = (
+        np.ravel(column) for column in np.broadcast_arrays(
+            np.asarray(scenario, dtype=np.int64),
+            np.asarray(power_watts, dtype=np.float64),
+            np.asarray(growth_factor, dtype=np.float64),
+            np.asarray(years, dtype=np.float64),
+            np.asarray(equity_score, dtype=np.float64),
+            np.asarray(sustainability_score, dtype=np.float64),
+            np.asarray(population, dtype=np.float64),
+        ))
+    ids, codes = np.unique(scenario, return_inverse=True)
+    codes = codes.ravel()
+    n = len(ids)
+
+    def segment_sum(values):
+        return np.bincount(codes, weights=values, minlength=n)
+
+    rows = np.bincount(codes, minlength=n)
+    total_power = segment_sum(power_watts)
+    future_power = segment_sum(power_watts * growth_factor)
+    total_population = segment_sum(population)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        evaluation = evaluate_paths(
+            future_power / total_power,
+            segment_sum(years) / rows,
+            segment_sum(population * equity_score) / total_population,
+            segment_sum(population * sustainability_score) / total_population,
+            current_power_watts=total_power, weights=weights, ethical_threshold=ethical_threshold,
+            base_remorse_horizon=base_remorse_horizon, robustness_bonus=robustness_bonus,
+            k_progress_cap=k_progress_cap,
+        )
+
+    out = np.empty(n, dtype=REGIONAL_DTYPE)
+    out["scenario"] = ids
+    out["num_regions"] = rows
+    out["power_watts"] = total_power
+    out["future_power_watts"] = future_power
+    out["population"] = total_population
+    for name in EVALUATION_DTYPE.names:
+        out[name] = evaluation[name]
+    return out
+
+
+def evaluate_region_grid(power_watts, growth_factors, years, equity_scores, sustainability_scores,
+                         population=1.0, **scoring):
+    """
+    Scenarios x regions convenience form of evaluate_regions: per-region baselines of length R
+    (e.g. columns of HistoricalDataset.select(year)), growth / equity / sustainability
+    broadcastable to (S, R) and years a scalar or one horizon per scenario. Scenario ids are
+    the row numbers 0..S-1.
+    """
+    growth_factors = np.atleast_2d(np.asarray(growth_factors, dtype=np.float64))
+    years = np.asarray(years, dtype=np.float64)
+    if years.ndim == 1:
+        years = years[:, None]
+    shape = np.broadcast_shapes(growth_factors.shape, years.shape, np.shape(equity_scores),
+                                np.shape(sustainability_scores), np.shape(power_watts), np.shape(population))
+    scenario = np.broadcast_to(np.arange(shape[0])[:, None], shape)
+    return evaluate_regions(scenario, power_watts, growth_factors, years, equity_scores, sustainability_scores,
+                            population, **scoring)
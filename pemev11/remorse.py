@@ -0,0 +1,104 @@
+import numpy as np
+
+# Remorse accumulated along year-by-year trajectories (see trajectory.py).
+#
+# Per path the ledger keeps yearly remorse r[t], discounted prefix sums C[t] = sum_{u<=t} d^u r[u]
+# (d = 1 / (1 + discount_rate)), sums over every `window`-year span and the first year the
+# horizon reaches `level`. Equity and sustainability enter the score linearly and only in their
+# own year, so revising them at (path, year) shifts r at that single year by -w * delta. An
+# update therefore adds cumsum(delta) to the touched paths' prefix sums and window sums instead
+# of re-simulating their trajectories; only maxima and crossings of touched paths are redone.
+
+REMORSE_SUMMARY_DTYPE = np.dtype([
+    ("discounted_remorse", "f8"),
+    ("worst_window_remorse", "f8"),
+    ("worst_window_start", "f8"),  # first year of the worst window
+    ("first_crossing", "f8"),  # first year with remorse_horizon >= level, NaN if never
+])
+
+
+class RemorseLedger:
+    """
+    Cumulative remorse for a (paths x years) TRAJECTORY_DTYPE array, with incremental updates
+    when single years' equity / sustainability values are revised.
+    """
+
+    def __init__(self, trajectories, weights=(0.3, 0.4, 0.3), discount_rate=0.03, window=10, level=0.0):
+        trajectories = np.atleast_2d(trajectories)
+        self.years = np.array(trajectories["year"][0])
+        self.remorse = np.array(trajectories["remorse_horizon"], dtype=np.float64)
+        self.equity = np.array(trajectories["equity"], dtype=np.float64)
+        self.sustainability = np.array(trajectories["sustainability"], dtype=np.float64)
+        _, self.weight_equity, self.weight_sustainability = weights
+        self.window = min(window, self.remorse.shape[1])
+        self.level = level
+        self.discount = (1.0 / (1.0 + discount_rate)) ** np.arange(self.remorse.shape[1])
+
+        self.cumulative = np.cumsum(self.remorse * self.discount, axis=1)
+        self.window_sums = self._window_sums(self.remorse)
+        self.worst_window = np.empty(len(self.remorse))
+        self.worst_window_index = np.empty(len(self.remorse), dtype=np.int64)
+        self.first_crossing = np.empty(len(self.remorse))
+        self._refresh(slice(None))
+
+    def _window_sums(self, values):
+        padded = np.zeros((len(values), values.shape[1] + 1))
+        np.cumsum(values, axis=1, out=padded[:, 1:])
+        return padded[:, self.window:] - padded[:, :-self.window]
+
+    def _refresh(self, rows):
+        sums = self.window_sums[rows]
+        self.worst_window_index[rows] = np.argmax(sums, axis=1)
+        self.worst_window[rows] = np.max(sums, axis=1)
+        crossed = self.remorse[rows] >= self.level
+        first = np.argmax(crossed, axis=1)
+        self.first_crossing[rows] = np.where(crossed.any(axis=1), self.years[first], np.nan)
+
+    def update(self, paths, year_index, equity=None, sustainability=None):
+        """
+        Revise equity and/or sustainability at (paths[i], year_index[i]) to new values (arrays
+        or scalars, broadcast together). Costs O(touched paths x years), independent of the
+        number of untouched paths. Returns the touched path indices.
+        """
+        paths, year_index = (np.ravel(a) for a in np.broadcast_arrays(np.asarray(paths, dtype=np.int64),
+                                                                      np.asarray(year_index, dtype=np.int64)))
+        # A (path, year) given more than once keeps its last value, as a plain assignment would
+        _, last = np.unique((paths * self.remorse.shape[1] + year_index)[::-1], return_index=True)
+        last = len(paths) - 1 - last
+
+        def revised(values, shape=paths.shape):
+            return np.broadcast_to(np.asarray(values, dtype=np.float64), shape)[last]
+
+        paths, year_index = paths[last], year_index[last]
+        delta_score = np.zeros(len(paths))
+        if equity is not None:
+            equity = revised(equity)
+            delta_score += self.weight_equity * (equity - self.equity[paths, year_index])
+            self.equity[paths, year_index] = equity
+        if sustainability is not None:
+            sustainability = revised(sustainability)
+            delta_score += self.weight_sustainability * (sustainability - self.sustainability[paths, year_index])
+            self.sustainability[paths, year_index] = sustainability
+
+        touched, rows = np.unique(paths, return_inverse=True)
+        delta = np.zeros((len(touched), self.remorse.shape[1]))
+        delta[rows.ravel(), year_index] = -delta_score  # remorse = base + 1 - score; cells are unique
+
+        self.remorse[touched] += delta
+        self.cumulative[touched] += np.cumsum(delta * self.discount, axis=1)
+        self.window_sums[touched] += self._window_sums(delta)
+        self._refresh(touched)
+        return touched
+
+    def cumulative_at(self, year_index):
+        """Discounted cumulative remorse of every path up to and including `year_index`."""
+        return self.cumulative[:, year_index]
+
+    def summary(self):
+        """Per-path REMORSE_SUMMARY_DTYPE: total discounted remorse, worst window, first crossing."""
+        out = np.empty(len(self.remorse), dtype=REMORSE_SUMMARY_DTYPE)
+        out["discounted_remorse"] = self.cumulative[:, -1]
+        out["worst_window_remorse"] = self.worst_window
+        out["worst_window_start"] = self.years[self.worst_window_index]
+        out["first_crossing"] = self.first_crossing
+        return out
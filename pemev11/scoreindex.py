@@ -0,0 +1,197 @@
+import json
+import os
+
+import numpy as np
+
+# Threshold-free index over computed ethical scores.
+#
+# The score does not depend on ethical_threshold, so once scores are sorted every guidance
+# question is a binary search: RECOMMEND count at threshold t is n - searchsorted(scores, t),
+# and the paths that flip between thresholds t1 < t2 are the slice [t1, t2). Appends are
+# written as new sorted runs (only the new scores are sorted). Runs are size-tiered: the newest
+# run is merged into the one before it while that one is less than `merge_ratio` times its size,
+# so run sizes shrink geometrically, there are O(log N) runs for queries to search, and each
+# row is rewritten O(log N) times over the life of the index, however small the appends.
+
+
+class ScoreIndex:
+    """
+    Sorted (score, path id) runs stored as memory-mapped .npy files.
+
+    Layout of the index directory:
+      meta.json                     scoring parameters, path count, run names
+      run_<n>_scores.npy            ascending ethical scores of one run
+      run_<n>_ids.npy               path ids in the same order
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self._runs = [self._load(name) for name in self.meta["runs"]]
+
+    @classmethod
+    def create(cls, path, params=None, merge_ratio=2.0):
+        """Empty index; `params` (e.g. scoring_params() minus the threshold) guards later appends."""
+        os.makedirs(path, exist_ok=True)
+        meta = {"params": params, "rows": 0, "runs": [], "next_run": 0, "merge_ratio": merge_ratio}
+        cls._write_meta(path, meta)
+        return cls(path)
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def append(self, scores, ids=None):
+        """
+        Add scores (array, or evaluate_paths records) for new paths. ids default to the running
+        row number, i.e. the order paths were appended in. Returns the ids assigned.
+        """
+        scores = np.ravel(scores["ethical_score"] if getattr(scores, "dtype", None) is not None
+                          and scores.dtype.names else np.asarray(scores, dtype=np.float64))
+        if ids is None:
+            ids = np.arange(len(self), len(self) + len(scores), dtype=np.int64)
+        ids = np.ravel(np.asarray(ids, dtype=np.int64))
+        if len(ids) != len(scores):
+            raise ValueError(f"{len(scores)} scores but {len(ids)} ids")
+        if not len(scores):
+            return ids
+
+        order = np.argsort(scores, kind="stable")
+        run = (scores[order], ids[order])
+        merged = []
+        while self._runs and len(self._runs[-1][0]) < self.meta["merge_ratio"] * len(run[0]):
+            run = merge_runs(self._runs.pop(), run)
+            merged.append(self.meta["runs"].pop())
+        self._commit_run(run, merged)
+        self.meta["rows"] += len(scores)
+        self._write_meta(self.path, self.meta)
+        self._remove_runs(merged)
+        return ids
+
+    def compact(self):
+        """Merge all runs into one, e.g. before archiving a finished index."""
+        if len(self._runs) <= 1:
+            return
+        run = self._runs[-1]
+        for older in reversed(self._runs[:-1]):
+            run = merge_runs(older, run)
+        merged = self.meta["runs"]
+        self.meta["runs"], self._runs = [], []
+        self._commit_run(run, merged)
+        self._write_meta(self.path, self.meta)
+        self._remove_runs(merged)
+
+    def count_recommended(self, thresholds):
+        """Number of paths with score >= threshold, for each threshold (vectorized)."""
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        below = sum(np.searchsorted(run_scores, thresholds, side="left") for run_scores, _ in self._runs)
+        return len(self) - np.asarray(below, dtype=np.int64)
+
+    def recommend_fraction(self, thresholds):
+        return self.count_recommended(thresholds) / max(len(self), 1)
+
+    def count_range(self, low, high):
+        """Number of paths with low <= score < high."""
+        return int(sum(np.searchsorted(run_scores, high, side="left") - np.searchsorted(run_scores, low, side="left")
+                       for run_scores, _ in self._runs))
+
+    def range(self, low, high):
+        """(scores, ids) of paths with low <= score < high, ascending by score."""
+        scores, ids = [], []
+        for run_scores, run_ids in self._runs:
+            lo, hi = np.searchsorted(run_scores, [low, high], side="left")
+            scores.append(run_scores[lo:hi])
+            ids.append(run_ids[lo:hi])
+        if not scores:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        scores, ids = np.concatenate(scores), np.concatenate(ids)
+        order = np.argsort(scores, kind="stable")
+        return scores[order], ids[order]
+
+    def flips(self, threshold_a, threshold_b):
+        """Ids of paths whose guidance differs between the two thresholds (RECOMMEND only at the lower)."""
+        low, high = sorted((threshold_a, threshold_b))
+        return self.range(low, high)[1]
+
+    def top(self, k):
+        """(scores, ids) of the k best-scoring paths, best first."""
+        scores, ids = [], []
+        for run_scores, run_ids in self._runs:
+            scores.append(run_scores[-k:] if k else run_scores[:0])
+            ids.append(run_ids[-k:] if k else run_ids[:0])
+        if not scores:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        scores, ids = np.concatenate(scores), np.concatenate(ids)
+        order = np.argsort(-scores, kind="stable")[:k]
+        return scores[order], ids[order]
+
+    def _commit_run(self, run, merged):
+        """Write a run and list it in meta (meta.json itself is written by the caller)."""
+        name = f"run_{self.meta['next_run']:06d}"
+        self.meta["next_run"] += 1
+        np.save(os.path.join(self.path, f"{name}_scores.npy"), run[0])
+        np.save(os.path.join(self.path, f"{name}_ids.npy"), run[1])
+        self.meta["runs"].append(name)
+        self._runs.append(self._load(name))
+
+    def _remove_runs(self, names):
+        # Only called after meta.json stopped listing them, so a crash never leaves it pointing at nothing
+        for name in names:
+            for suffix in ("scores", "ids"):
+                os.remove(os.path.join(self.path, f"{name}_{suffix}.npy"))
+
+    def _load(self, name):
+        return (np.load(os.path.join(self.path, f"{name}_scores.npy"), mmap_mode="r"),
+                np.load(os.path.join(self.path, f"{name}_ids.npy"), mmap_mode="r"))
+
+    @staticmethod
+    def _write_meta(path, meta):
+        tmp = os.path.join(path, "meta.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, os.path.join(path, "meta.json"))
+
+
+def merge_runs(older, newer):
+    """
+    Merge two sorted (scores, ids) runs in O(n + m log n) without re-sorting: each newer score's
+    output slot is its insertion point in the older run plus its own rank. Ties keep older first.
+    """
+    (older_scores, older_ids), (newer_scores, newer_ids) = older, newer
+    size = len(older_scores) + len(newer_scores)
+    slots = np.searchsorted(older_scores, newer_scores, side="right") + np.arange(len(newer_scores))
+    from_older = np.ones(size, dtype=bool)
+    from_older[slots] = False
+    scores = np.empty(size, dtype=np.float64)
+    ids = np.empty(size, dtype=np.int64)
+    scores[slots], ids[slots] = newer_scores, newer_ids
+    scores[from_older], ids[from_older] = older_scores, older_ids
+    return scores, ids
+
+
+def open_score_index(path, params=None, merge_ratio=2.0):
+    """Open the index at `path`, creating it if missing; raises ValueError if built with other params."""
+    if not os.path.exists(os.path.join(path, "meta.json")):
+        return ScoreIndex.create(path, params, merge_ratio)
+    index = ScoreIndex(path)
+    if params is not None and index.meta["params"] != json.loads(json.dumps(params)):
+        raise ValueError(f"Existing score index at {path} was built with different scoring parameters")
+    return index
+
+
+def index_file(input_path, index_path, vector=None, chunk_rows=1_000_000):
+    """
+    Score the scenarios of a CSV or .npy file (see stream.evaluate_file) and append them to the
+    index at `index_path` chunk by chunk. Ids continue from the rows already indexed.
+    """
+    from pemev11.stream import read_csv_chunks, read_npy_chunks
+
+    if vector is None:
+        from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+        vector = PlanetaryEnergyMasteryEthicalVector()
+    index = vector.score_index(index_path)
+    reader = read_npy_chunks if input_path.endswith(".npy") else read_csv_chunks
+    for columns in reader(input_path, chunk_rows):
+        index.append(vector.evaluate_paths_ethical(columns["growth_factor"], columns["years"],
+                                                   columns.get("equity"), columns.get("sustainability")))
+    return index
@@ -0,0 +1,99 @@
+import datetime
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+
+from pemev11.qday import get_default_pool
+
+# Randomness for weight seeding and Monte Carlo comes from QDay (or os.urandom) seed material
+# fed into a NumPy SeedSequence; each Monte Carlo sample block gets a spawned child, and these are
+# statistically independent. Journaling the material lets any run be replayed bit-for-bit
+# offline: SeedJournal.seed_sequence(entry_id) rebuilds the same SeedSequence without a fetch.
+
+SEED_BYTES = 32
+
+
+def draw_seed_material(num_bytes=SEED_BYTES, quantum=True, pool=None):
+    """(bytes, source): QDay pool bytes when quantum and available, os.urandom otherwise."""
+    if quantum:
+        data = (pool or get_default_pool()).take(num_bytes)
+        if data:
+            return data, "qday"
+    return os.urandom(num_bytes), "urandom"
+
+
+def seed_sequence_from_bytes(material):
+    return np.random.SeedSequence(int.from_bytes(material, "little"))
+
+
+class SeedJournal:
+    """
+    Append-only JSON Lines record of seed material: one entry per seeded run with its id,
+    purpose (e.g. "seed_weights", "recommend_probability"), source, hex material and UTC time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, purpose, source, material):
+        entry = {
+            "id": uuid.uuid4().hex[:16],
+            "purpose": purpose,
+            "source": source,
+            "material": material.hex(),
+            "time": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        }
+        with self._lock, open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry["id"]
+
+    def entries(self, purpose=None):
+        try:
+            with open(self.path) as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+        return [entry for entry in entries if purpose is None or entry["purpose"] == purpose]
+
+    def get(self, entry_id):
+        for entry in self.entries():
+            if entry["id"] == entry_id:
+                return entry
+        raise KeyError(f"No seed journal entry {entry_id!r} in {self.path}")
+
+    def material(self, entry_id):
+        return bytes.fromhex(self.get(entry_id)["material"])
+
+    def seed_sequence(self, entry_id):
+        """The exact SeedSequence of a journaled run (no network, no new entropy)."""
+        return seed_sequence_from_bytes(self.material(entry_id))
+
+
+def new_seed_sequence(purpose, quantum=True, journal=None, pool=None):
+    """
+    Fresh SeedSequence from QDay/os.urandom material, journaled when a journal is given.
+    Returns (seed_sequence, entry_id or None).
+    """
+    material, source = draw_seed_material(SEED_BYTES, quantum, pool)
+    entry_id = journal.record(purpose, source, material) if journal is not None else None
+    return seed_sequence_from_bytes(material), entry_id
+
+
+_default_journal = None
+_default_journal_lock = threading.Lock()
+
+
+def get_default_journal():
+    """Process-wide journal at PEMEV11_SEED_JOURNAL, or None when journaling is not configured."""
+    global _default_journal
+    path = os.environ.get("PEMEV11_SEED_JOURNAL")
+    if not path:
+        return None
+    with _default_journal_lock:
+        if _default_journal is None or _default_journal.path != path:
+            _default_journal = SeedJournal(path)
+        return _default_journal
@@ -0,0 +1,66 @@
+import numpy as np
+
+from pemev11.batch import CURRENT_KARDASHEV
+from pemev11.metrics import instrumented
+
+INPUTS = ("growth_factor", "equity", "sustainability", "weight_energy", "weight_equity", "weight_sustainability")
+
+SENSITIVITY_DTYPE = np.dtype(
+    [("ethical_score", "f8"), ("remorse_horizon", "f8"), ("margin", "f8"), ("k_progress", "f8"), ("clamped", "?")]
+    + [(f"d_score_d_{name}", "f8") for name in INPUTS]
+    + [(f"d_remorse_d_{name}", "f8") for name in INPUTS]
+)
+
+
+@instrumented("score_sensitivity", batch_size=np.size)
+def score_sensitivity(growth_factor, equity_score, sustainability_score, current_power_watts=2.3e13,
+                      weights=(0.3, 0.4, 0.3), ethical_threshold=0.95, base_remorse_horizon=-1.00,
+                      robustness_bonus=0.0):
+    """
+    Exact partial derivatives of ethical_score and remorse_horizon, one vectorized pass.
+
+    score = w_e * min(u(g), 1) + w_q * equity + w_s * sustainability + bonus,
+    u(g) = (K(P0 * g) - K0) / (1 - K0), so d score / d g = w_e / (10 (1 - K0) g ln 10) below
+    the clamp and 0 once k_progress is clamped at 1.0 (`clamped`; at the kink itself this is
+    the right-hand derivative: more growth no longer helps). Weight partials are unconstrained
+    (the sum-to-one renormalization is not applied). remorse = base + 1 - score, so its
+    partials are the negated score partials. `margin` is score - threshold.
+    """
+    growth_factor, equity_score, sustainability_score = np.broadcast_arrays(
+        np.asarray(growth_factor, dtype=np.float64),
+        np.asarray(equity_score, dtype=np.float64),
+        np.asarray(sustainability_score, dtype=np.float64),
+    )
+    weight_energy, weight_equity, weight_sustainability = weights
+
+    out = np.empty(growth_factor.shape, dtype=SENSITIVITY_DTYPE)
+    # u = (log10(g) + log10(P0) - 6 - 10 K0) / (10 (1 - K0)), constants folded
+    progress = np.log10(growth_factor)
+    progress += np.log10(current_power_watts) - 6 - 10 * CURRENT_KARDASHEV
+    progress /= 10 * (1.0 - CURRENT_KARDASHEV)
+    clamped = out["clamped"]
+    np.greater_equal(progress, 1.0, out=clamped)
+    k_progress = out["k_progress"]
+    np.minimum(progress, 1.0, out=k_progress)
+
+    score = out["ethical_score"]
+    np.multiply(k_progress, weight_energy, out=score)
+    score += weight_equity * equity_score
+    score += weight_sustainability * sustainability_score
+    score += robustness_bonus
+    np.subtract(base_remorse_horizon + 1.0, score, out=out["remorse_horizon"])
+    np.subtract(score, ethical_threshold, out=out["margin"])
+
+    d_growth = out["d_score_d_growth_factor"]
+    np.divide(weight_energy / (10 * (1.0 - CURRENT_KARDASHEV) * np.log(10)), growth_factor, out=d_growth)
+    np.copyto(d_growth, 0.0, where=clamped)
+    out["d_score_d_equity"] = weight_equity
+    out["d_score_d_sustainability"] = weight_sustainability
+    out["d_score_d_weight_energy"] = k_progress
+    out["d_score_d_weight_equity"] = equity_score
+    out["d_score_d_weight_sustainability"] = sustainability_score
+
+    for name in INPUTS:
+        np.negative(out[f"d_score_d_{name}"], out=out[f"d_remorse_d_{name}"])
+    return out
+
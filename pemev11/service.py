@@ -0,0 +1,174 @@
+import asyncio
+import collections
+import json
+import time
+
+import numpy as np
+
+from pemev11.batch import evaluate_paths
+
+INPUT_FIELDS = ("growth_factor", "years", "equity", "sustainability")
+OUTPUT_FIELDS = ("future_k", "k_progress", "ethical_score", "remorse_horizon", "guidance")
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent evaluate requests into one vectorized evaluate_paths call.
+
+    The first request of a batch opens a `window` (seconds); everything that arrives before
+    it closes (or until `max_batch` paths are queued) is scored together and split back
+    per request. Keeps rolling latency and batch-size samples for /stats.
+    """
+
+    def __init__(self, vector, window=0.002, max_batch=65536, stats_size=10000):
+        self.vector = vector
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = []
+        self._pending_paths = 0
+        self._flush_handle = None
+        self.latencies = collections.deque(maxlen=stats_size)
+        self.batch_sizes = collections.deque(maxlen=stats_size)
+        self.requests = 0
+        self.batches = 0
+
+    async def evaluate(self, columns):
+        """Score one request's columns (dict of equal-length arrays); returns its slice of the batch."""
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((columns, future))
+        self._pending_paths += len(columns["growth_factor"])
+        if self._pending_paths >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+        result = await future
+        self.latencies.append(time.perf_counter() - start)
+        self.requests += 1
+        return result
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending, self._pending_paths = self._pending, [], 0
+        if not batch:
+            return
+
+        try:
+            merged = {name: np.concatenate([columns[name] for columns, _ in batch]) for name in INPUT_FIELDS}
+            results = evaluate_paths(merged["growth_factor"], merged["years"], merged["equity"],
+                                     merged["sustainability"], **self.vector.scoring_params())
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.batch_sizes.append(len(results))
+        offset = 0
+        for columns, future in batch:
+            n = len(columns["growth_factor"])
+            if not future.done():
+                future.set_result(results[offset:offset + n])
+            offset += n
+
+    def stats(self):
+        latencies_ms = np.array(self.latencies) * 1000
+        sizes = np.array(self.batch_sizes)
+        percentiles = (50, 90, 99)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "latency_ms": ({f"p{p}": float(v) for p, v in zip(percentiles, np.percentile(latencies_ms, percentiles))}
+                           if len(latencies_ms) else {}),
+            "batch_size": ({"mean": float(sizes.mean()), "max": int(sizes.max())} if len(sizes) else {}),
+        }
+
+
+def parse_request_columns(payload, vector):
+    """JSON body → dict of equal-length float arrays (equity/sustainability default to real-world hints)."""
+    if "growth_factor" not in payload or "years" not in payload:
+        raise ValueError("growth_factor and years are required")
+    columns = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(payload["growth_factor"], dtype=np.float64)),
+        np.atleast_1d(np.asarray(payload["years"], dtype=np.float64)),
+        np.atleast_1d(np.asarray(payload.get("equity", vector.current_equity), dtype=np.float64)),
+        np.atleast_1d(np.asarray(payload.get("sustainability", vector.current_sustainability), dtype=np.float64)),
+    )
+    return {name: np.ravel(column) for name, column in zip(INPUT_FIELDS, columns)}
+
+
+class ScoringService:
+    """Minimal HTTP/1.1 (keep-alive) server over TCP or a Unix socket: POST /evaluate, GET /stats."""
+
+    def __init__(self, vector=None, window=0.002, max_batch=65536):
+        if vector is None:
+            from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+            vector = PlanetaryEnergyMasteryEthicalVector()
+        self.vector = vector
+        self.batcher = MicroBatcher(vector, window, max_batch)
+
+    async def start(self, host="127.0.0.1", port=8711, unix_path=None):
+        if unix_path:
+            return await asyncio.start_unix_server(self._handle, path=unix_path)
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def serve_forever(self, host="127.0.0.1", port=8711, unix_path=None):
+        server = await self.start(host, port, unix_path)
+        print(f"PEMEV-11 scoring service listening on {unix_path or f'http://{host}:{port}'}")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, response = await self._route(method, target, body)
+                data = json.dumps(response).encode()
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode("latin1") + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, target, body):
+        path = target.split("?", 1)[0]
+        if method == "GET" and path == "/stats":
+            return "200 OK", self.batcher.stats()
+        if method == "POST" and path == "/evaluate":
+            try:
+                columns = parse_request_columns(json.loads(body or b"{}"), self.vector)
+            except (ValueError, TypeError) as e:
+                return "400 Bad Request", {"error": str(e)}
+            results = await self.batcher.evaluate(columns)
+            response = {name: results[name].tolist() for name in OUTPUT_FIELDS}
+            response["threshold"] = self.vector.ethical_threshold
+            return "200 OK", response
+        return "404 Not Found", {"error": f"no route for {method} {path}"}
+
+
+def serve(host="127.0.0.1", port=8711, unix_path=None, window=0.002, vector=None):
+    """Run the scoring service until interrupted."""
+    service = ScoringService(vector, window)
+    try:
+        asyncio.run(service.serve_forever(host, port, unix_path))
+    except KeyboardInterrupt:
+        pass
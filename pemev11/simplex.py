@@ -0,0 +1,96 @@
+import numpy as np
+
+from pemev11.batch import kardashev_progress
+from pemev11.metrics import instrumented
+
+# Exact RECOMMEND region on the weight simplex.
+#
+# With weights w = (w_energy, w_equity, w_sustainability) on the 2-simplex the score is linear
+# in w: score(w) = sum_i w_i c_i + bonus, c = (min(k_progress, 1), equity, sustainability).
+# Writing g_i = c_i + bonus - threshold (the margin at the pure-energy / pure-equity /
+# pure-sustainability corners), RECOMMEND is the half-plane sum_i w_i g_i >= 0, so the region
+# is the triangle clipped by one line: empty, a corner triangle, a quadrilateral or everything.
+# Its area fraction is a product of two edge fractions at the lone corner on one side.
+
+RECOMMEND_REGION_DTYPE = np.dtype([
+    ("area_fraction", "f8"),
+    ("num_vertices", "i1"),
+    ("vertices", "f8", (4, 3)),  # (w_energy, w_equity, w_sustainability) per vertex, NaN padded
+    ("corner_margin", "f8", (3,)),  # g at the energy / equity / sustainability corners
+])
+
+
+def corner_margins(growth_factor, equity_score, sustainability_score, current_power_watts=2.3e13,
+                   ethical_threshold=0.95, robustness_bonus=0.0):
+    """(n, 3) score - threshold at the three pure-weight corners of the simplex."""
+    k_progress = np.minimum(kardashev_progress(growth_factor, current_power_watts), 1.0)
+    corners = np.stack(np.broadcast_arrays(
+        k_progress,
+        np.asarray(equity_score, dtype=np.float64),
+        np.asarray(sustainability_score, dtype=np.float64),
+    ), axis=-1)
+    return corners + (robustness_bonus - ethical_threshold)
+
+
+def recommend_area_fraction(margins):
+    """Exact fraction of the simplex (uniform measure) where sum_i w_i g_i >= 0, per row of `margins`."""
+    g = np.asarray(margins, dtype=np.float64)
+    inside = g >= 0
+    count = inside.sum(axis=-1)
+    # The corner alone on its side of the line: inside when count == 1, outside when count == 2
+    lone = np.argmax(np.where(count[..., None] == 1, inside, ~inside), axis=-1)
+    g_lone = np.take_along_axis(g, lone[..., None], axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Edge fraction from the lone corner to where g crosses zero (others are on the far side)
+        t = np.where(np.arange(3) == lone[..., None], 1.0, g_lone / (g_lone - g))
+    corner = t.prod(axis=-1)
+    return np.select([count == 0, count == 1, count == 2], [0.0, corner, 1.0 - corner], 1.0)
+
+
+def recommend_polygon(margins):
+    """
+    Vertices of the RECOMMEND polygon per row (Sutherland-Hodgman clip of the simplex triangle),
+    as (n, 4, 3) weight triples padded with NaN, plus the vertex count.
+    """
+    g = np.asarray(margins, dtype=np.float64).reshape(-1, 3)
+    n = len(g)
+    corners = np.eye(3)
+    candidates = np.full((n, 6, 3), np.nan)
+    valid = np.zeros((n, 6), dtype=bool)
+    for edge in range(3):
+        i, j = edge, (edge + 1) % 3
+        # Corner i if inside, then the crossing on edge i -> j if the edge changes side
+        valid[:, 2 * edge] = g[:, i] >= 0
+        candidates[:, 2 * edge] = corners[i]
+        crossing = (g[:, i] >= 0) != (g[:, j] >= 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = g[:, i] / (g[:, i] - g[:, j])
+            candidates[:, 2 * edge + 1] = (1 - t)[:, None] * corners[i] + t[:, None] * corners[j]
+        valid[:, 2 * edge + 1] = crossing
+
+    # Compact valid candidates to the front, keeping their order around the boundary
+    order = np.argsort(~valid, axis=1, kind="stable")[:, :4]
+    vertices = np.take_along_axis(candidates, order[:, :, None], axis=1)
+    num_vertices = valid.sum(axis=1)
+    vertices[np.arange(4) >= num_vertices[:, None]] = np.nan
+    return vertices, num_vertices
+
+
+@instrumented("recommend_region", batch_size=np.size)
+def recommend_region(growth_factor, equity_score, sustainability_score, current_power_watts=2.3e13,
+                     ethical_threshold=0.95, robustness_bonus=0.0):
+    """
+    Exact set of (energy, equity, sustainability) weight triples that RECOMMEND each path:
+    polygon vertices plus its area fraction of the simplex. The area fraction is the probability
+    under uniformly distributed weights; seed_weights_with_quantum_randomness normalizes three
+    uniforms instead (not uniform on the simplex), which montecarlo.recommend_probability samples.
+    """
+    margins = corner_margins(growth_factor, equity_score, sustainability_score, current_power_watts,
+                             ethical_threshold, robustness_bonus)
+    out = np.empty(margins.shape[:-1], dtype=RECOMMEND_REGION_DTYPE)
+    out["corner_margin"] = margins
+    out["area_fraction"] = recommend_area_fraction(margins)
+    vertices, num_vertices = recommend_polygon(margins)
+    out["vertices"] = vertices.reshape(out.shape + (4, 3))
+    out["num_vertices"] = num_vertices.reshape(out.shape)
+    return out
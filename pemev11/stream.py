@@ -0,0 +1,172 @@
+import queue
+import threading
+import warnings
+
+import numpy as np
+
+from pemev11.batch import EVALUATION_DTYPE, evaluate_paths
+
+COLUMNS = ("growth_factor", "years", "equity", "sustainability")
+COLUMN_ALIASES = {
+    "growth": "growth_factor",
+    "equity_score": "equity",
+    "sustainability_score": "sustainability",
+}
+
+_DONE = object()
+
+
+def _column_index(header):
+    """Map input columns to COLUMNS positions from a CSV header or structured dtype names."""
+    names = [COLUMN_ALIASES.get(name.strip().lower(), name.strip().lower()) for name in header]
+    missing = [name for name in COLUMNS[:2] if name not in names]
+    if missing:
+        raise ValueError(f"Scenario file is missing column(s): {', '.join(missing)}")
+    return {name: names.index(name) for name in COLUMNS if name in names}
+
+
+def read_csv_chunks(path, chunk_rows):
+    """Yield dicts of column arrays from a CSV with a header row, `chunk_rows` rows at a time."""
+    with open(path) as f:
+        index = _column_index(f.readline().split(","))
+        usecols = list(index.values())
+        while True:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)  # "input contained no data" at EOF
+                block = np.loadtxt(f, delimiter=",", usecols=usecols, max_rows=chunk_rows, ndmin=2)
+            if not len(block):
+                return
+            yield {name: block[:, i] for i, name in enumerate(index)}
+
+
+def read_npy_chunks(path, chunk_rows):
+    """Yield dicts of column arrays from a memory-mapped .npy (structured, or (n, 4) in COLUMNS order)."""
+    data = np.load(path, mmap_mode="r")
+    if data.dtype.names:
+        index = _column_index(data.dtype.names)
+        fields = [data.dtype.names[i] for i in index.values()]
+    for start in range(0, len(data), chunk_rows):
+        block = data[start:start + chunk_rows]
+        if data.dtype.names:
+            yield {name: np.asarray(block[field], dtype=np.float64) for name, field in zip(index, fields)}
+        else:
+            yield {name: np.asarray(block[:, i], dtype=np.float64) for i, name in enumerate(COLUMNS[:block.shape[1]])}
+
+
+class NpyStreamWriter:
+    """Append record chunks to a .npy file whose length is only known at close()."""
+
+    # Room for any row count in the rewritten header
+    _SHAPE_WIDTH = 24
+
+    def __init__(self, path, dtype):
+        self.dtype = np.dtype(dtype)
+        self.rows = 0
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        shape = f"({self.rows},)".ljust(self._SHAPE_WIDTH)
+        header = (f"{{'descr': {np.lib.format.dtype_to_descr(self.dtype)!r}, "
+                  f"'fortran_order': False, 'shape': {shape}, }}")
+        # NPY v1.0: magic + uint16 header length; header padded with spaces to 64-byte alignment
+        pad = -(len(header) + 11) % 64
+        header = (header + " " * pad + "\n").encode("latin1")
+        self._file.seek(0)
+        self._file.write(np.lib.format.magic(1, 0) + len(header).to_bytes(2, "little") + header)
+
+    def write(self, records):
+        self._file.write(np.ascontiguousarray(records, dtype=self.dtype).tobytes())
+        self.rows += len(records)
+
+    def close(self):
+        self._write_header()
+        self._file.close()
+
+
+class CsvStreamWriter:
+    """Append record chunks to a CSV file with a header row."""
+
+    def __init__(self, path, dtype):
+        self.dtype = np.dtype(dtype)
+        self.rows = 0
+        self._file = open(path, "w")
+        self._file.write(",".join(self.dtype.names) + "\n")
+        self._fmt = ["%d" if self.dtype[name].kind in "iub" else "%.10g" for name in self.dtype.names]
+
+    def write(self, records):
+        np.savetxt(self._file, records, fmt=self._fmt, delimiter=",")
+        self.rows += len(records)
+
+    def close(self):
+        self._file.close()
+
+
+def _stage(source, sink, func):
+    """Pipeline stage: apply func to each item of `source` queue and put results on `sink`."""
+    try:
+        while True:
+            item = source.get()
+            if item is _DONE or isinstance(item, BaseException):
+                sink.put(item)
+                return
+            sink.put(func(item))
+    except BaseException as e:
+        sink.put(e)
+
+
+def evaluate_file(input_path, output_path, vector=None, chunk_rows=1_000_000, depth=2):
+    """
+    Evaluate scenarios from a CSV or .npy file and write EVALUATION_DTYPE results to .npy or .csv.
+
+    Reading, scoring and writing run as three threads joined by bounded queues (`depth` chunks
+    each), so they overlap and memory stays at a few chunks regardless of file size.
+    Missing equity/sustainability columns fall back to the vector's real-world hints.
+    Returns the number of rows written.
+    """
+    if vector is None:
+        from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+        vector = PlanetaryEnergyMasteryEthicalVector()
+    params = vector.scoring_params()
+
+    reader = read_npy_chunks if input_path.endswith(".npy") else read_csv_chunks
+    writer = (NpyStreamWriter if output_path.endswith(".npy") else CsvStreamWriter)(output_path, EVALUATION_DTYPE)
+
+    def score(columns):
+        return evaluate_paths(
+            columns["growth_factor"], columns["years"],
+            columns.get("equity", vector.current_equity),
+            columns.get("sustainability", vector.current_sustainability),
+            **params,
+        )
+
+    parsed = queue.Queue(maxsize=depth)
+    scored = queue.Queue(maxsize=depth)
+
+    def read():
+        try:
+            for chunk in reader(input_path, chunk_rows):
+                parsed.put(chunk)
+        except BaseException as e:
+            parsed.put(e)
+            return
+        parsed.put(_DONE)
+
+    threads = [threading.Thread(target=read, daemon=True),
+               threading.Thread(target=_stage, args=(parsed, scored, score), daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = scored.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            writer.write(item)
+    finally:
+        writer.close()
+    for thread in threads:
+        thread.join()
+    return writer.rows
@@ -0,0 +1,113 @@
+import numpy as np
+
+from pemev11.batch import CURRENT_KARDASHEV
+
+TRAJECTORY_DTYPE = np.dtype([
+    ("year", "f8"),
+    ("power_watts", "f8"),
+    ("kardashev", "f8"),
+    ("k_progress", "f8"),
+    ("equity", "f8"),
+    ("sustainability", "f8"),
+    ("ethical_score", "f8"),
+    ("remorse_horizon", "f8"),
+    ("guidance", "i1"),
+])
+
+CURVES = ("compound", "logistic")
+
+
+def growth_fraction(progress, curve="compound", steepness=10.0):
+    """
+    Share of the total log-growth reached at `progress` = t / years in [0, 1].
+    compound: constant annual rate (P0 * g ** progress); logistic: slow start, fast middle,
+    saturation, rescaled so it still runs from 0 at t=0 to 1 at t=years.
+    """
+    if curve == "compound":
+        return progress
+    if curve == "logistic":
+        lo = 1 / (1 + np.exp(steepness / 2))
+        hi = 1 / (1 + np.exp(-steepness / 2))
+        return (1 / (1 + np.exp(-steepness * (progress - 0.5))) - lo) / (hi - lo)
+    raise ValueError(f"Unknown growth curve {curve!r} (expected one of {CURVES})")
+
+
+def simulate_trajectories(growth_factor, years, equity_score, sustainability_score, horizon=None,
+                          curve="compound", steepness=10.0, start_equity=0.35, start_sustainability=0.65,
+                          start_year=0, current_power_watts=2.3e13, weights=(0.3, 0.4, 0.3),
+                          ethical_threshold=0.95, base_remorse_horizon=-1.00, robustness_bonus=0.0):
+    """
+    Year-by-year trajectories as a (paths x horizon+1) record array of TRAJECTORY_DTYPE.
+
+    Each path reaches `growth_factor` x today's power after `years` years along `curve`, while
+    equity and sustainability move linearly from today's values to the path's targets.
+    After its own `years` a path holds its end state until `horizon` (default: longest path).
+    """
+    growth_factor, years, equity_score, sustainability_score = (
+        a.reshape(-1, 1) for a in np.broadcast_arrays(
+            np.asarray(growth_factor, dtype=np.float64),
+            np.asarray(years, dtype=np.float64),
+            np.asarray(equity_score, dtype=np.float64),
+            np.asarray(sustainability_score, dtype=np.float64),
+        )
+    )
+    if horizon is None:
+        horizon = int(np.ceil(years.max())) if years.size else 0
+    weight_energy, weight_equity, weight_sustainability = weights
+
+    t = np.arange(horizon + 1, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        progress = np.where(years > 0, np.clip(t / years, 0.0, 1.0), 1.0)
+
+    out = np.empty((len(growth_factor), horizon + 1), dtype=TRAJECTORY_DTYPE)
+    out["year"] = start_year + t
+
+    log_power = np.log10(current_power_watts) + growth_fraction(progress, curve, steepness) * np.log10(growth_factor)
+    out["power_watts"] = 10.0 ** log_power
+    kardashev = out["kardashev"]
+    np.subtract(log_power, 6, out=kardashev)
+    kardashev /= 10
+
+    k_progress = out["k_progress"]
+    np.subtract(kardashev, CURRENT_KARDASHEV, out=k_progress)
+    k_progress /= (1.0 - CURRENT_KARDASHEV)
+    np.minimum(k_progress, 1.0, out=k_progress)
+
+    equity = out["equity"]
+    equity[...] = start_equity + progress * (equity_score - start_equity)
+    sustainability = out["sustainability"]
+    sustainability[...] = start_sustainability + progress * (sustainability_score - start_sustainability)
+
+    score = out["ethical_score"]
+    np.multiply(k_progress, weight_energy, out=score)
+    score += weight_equity * equity
+    score += weight_sustainability * sustainability
+    score += robustness_bonus
+
+    np.subtract(base_remorse_horizon + 1.0, score, out=out["remorse_horizon"])
+    out["guidance"] = score >= ethical_threshold
+    return out
+
+
+def iter_trajectories(growth_factor, years, equity_score, sustainability_score, horizon=None,
+                      chunk_size=65536, **kwargs):
+    """
+    Streaming simulate_trajectories: yields (start_index, block) over chunks of paths so memory
+    stays at one (chunk_size x horizon+1) block regardless of how many paths there are.
+    All chunks share one horizon (default: longest path overall).
+    """
+    growth_factor, years, equity_score, sustainability_score = (
+        a.ravel() for a in np.broadcast_arrays(
+            np.asarray(growth_factor, dtype=np.float64),
+            np.asarray(years, dtype=np.float64),
+            np.asarray(equity_score, dtype=np.float64),
+            np.asarray(sustainability_score, dtype=np.float64),
+        )
+    )
+    if horizon is None:
+        horizon = int(np.ceil(years.max())) if years.size else 0
+    for start in range(0, len(growth_factor), chunk_size):
+        stop = start + chunk_size
+        yield start, simulate_trajectories(growth_factor[start:stop], years[start:stop],
+                                           equity_score[start:stop], sustainability_score[start:stop],
+                                           horizon=horizon, **kwargs)
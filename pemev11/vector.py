@@ -0,0 +1,363 @@
+import datetime
+import os
+
+import numpy as np
+
+from pemev11.batch import CURRENT_KARDASHEV, Evaluation, evaluate_paths, format_evaluations
+from pemev11.boundary import min_equity, min_growth, min_sustainability
+from pemev11.coalitions import coalition_loss_distribution
+from pemev11.engine import ScoringEngine
+from pemev11.history import HistoricalDataset, population_weights
+from pemev11.metrics import count, instrumented
+from pemev11.montecarlo import recommend_probability, sample_weights
+from pemev11.pareto import PARETO_OBJECTIVES, pareto_frontier
+from pemev11.regions import evaluate_region_grid
+from pemev11.remorse import RemorseLedger
+from pemev11.scoreindex import open_score_index
+from pemev11.seeding import (SEED_BYTES, SeedJournal, draw_seed_material, get_default_journal,
+                             seed_sequence_from_bytes)
+from pemev11.sensitivity import score_sensitivity
+from pemev11.simplex import recommend_region
+from pemev11.trajectory import iter_trajectories, simulate_trajectories
+from pemev11.wstate import SparseWState, w_state_bonus
+
+
+class PlanetaryEnergyMasteryEthicalVector:
+    """
+    PEMEV-11 library vector
+    Ethical v2 weights/threshold + remorse link + real-data hints + W-state bonus,
+    with no side effects on construction unless quantum seeding is requested.
+    """
+
+    def __init__(self, use_quantum: bool = False, entropy_pool=None, seed_journal=None):
+        self.current_date = datetime.date.today()
+        self.current_power_watts = 2.3e13
+        self.type1_target_watts = 1.74e17
+
+        # Adjustable ethical weights (may be quantum seeded)
+        self.weight_energy = 0.3
+        self.weight_equity = 0.4
+        self.weight_sustainability = 0.3
+
+        # Adjustable threshold (0.9 = more lenient, 0.98 = stricter)
+        self.ethical_threshold = 0.95
+
+        # Vector 10 baseline: perfect remorse horizon
+        self.base_remorse_horizon = -1.00
+
+        # Real-world hints for current state
+        self.current_equity = 0.35  # Approx global inequality inverse ~2025
+        self.current_sustainability = 0.65  # Approx ESI average ~2025
+
+        # W-state params (3 stakeholders example: nations, ecosystems, generations)
+        self.num_stakeholders = 3
+        # Optional stakeholder shares (amplitude imbalance) and single-loss likelihoods for the W-state model
+        self.stakeholder_weights = None
+        self.stakeholder_loss_probabilities = None
+
+        # Shared QDay prefetch pool; seeding many vectors never blocks on the network per instance
+        self.entropy_pool = entropy_pool
+        self.use_quantum = use_quantum
+        # Seed material journal (SeedJournal or path) for bit-for-bit replay; ids of the last seeds drawn
+        self.seed_journal = seed_journal
+        self.seed_entry_ids = {}
+
+        if use_quantum:
+            self.seed_weights_with_quantum_randomness(debug=True)
+
+    def calculate_kardashev(self, power_watts):
+        """Sagan formula: K = (log10(P) - 6) / 10"""
+        return (np.log10(power_watts) - 6) / 10
+
+    def load_history(self, dataset, year, regions=None):
+        """
+        Replace the hard-coded current state with one year of a HistoricalDataset (or its path):
+        total power of the selected regions and their population-weighted equity/sustainability.
+        """
+        if isinstance(dataset, (str, os.PathLike)):
+            dataset = HistoricalDataset(dataset)
+        snapshot = dataset.snapshot(year, regions)
+        self.current_power_watts = snapshot["power_watts"]
+        self.current_equity = snapshot["equity"]
+        self.current_sustainability = snapshot["sustainability"]
+        self.current_date = datetime.date(snapshot["year"], 12, 31)
+        return self
+
+    def print_baseline(self):
+        k = self.calculate_kardashev(self.current_power_watts)
+        progress = (k / 1.0) * 100
+        gap = self.type1_target_watts / self.current_power_watts
+        print(f"PEMEV-11 Baseline - {self.current_date}")
+        print(f"Current energy: {self.current_power_watts:.2e} W")
+        print(f"Current Kardashev: {k:.3f}")
+        print(f"Progress to Type I: {progress:.1f}%")
+        print(f"Energy gap: ~{gap:.0f}x\n")
+
+    def project_future(self, growth_factor, years):
+        """Simple baseline projection"""
+        future_power = self.current_power_watts * growth_factor
+        future_k = self.calculate_kardashev(future_power)
+        future_progress = (future_k / 1.0) * 100
+        gap_remaining = self.type1_target_watts / future_power
+
+        print(f"\n=== Baseline Projection ===")
+        print(f"Scenario: {growth_factor}x energy growth over ~{years} years")
+        print(f"Future energy use: {future_power:.2e} W")
+        print(f"Future Kardashev level: {future_k:.3f}")
+        print(f"Progress to Type I: {future_progress:.1f}%")
+        print(f"Remaining energy gap: ~{gap_remaining:.0f}x")
+
+    def w_state_robustness_bonus(self):
+        """Bonus from the sparse W-state model: expected fidelity after losing one stakeholder."""
+        return w_state_bonus(self.num_stakeholders, self.stakeholder_weights, self.stakeholder_loss_probabilities)
+
+    def w_state(self):
+        """Sparse W state of the stakeholder groups (balanced unless stakeholder_weights is set)."""
+        if self.stakeholder_weights is not None:
+            return SparseWState.from_weights(self.stakeholder_weights)
+        return SparseWState.balanced(self.num_stakeholders)
+
+    def coalition_loss_robustness(self, loss_probabilities=0.1, max_lost=None, workers=1):
+        """Expected / worst-case W-state bonus over every coalition of independently lost stakeholders."""
+        return coalition_loss_distribution(self.w_state(), loss_probabilities, max_lost=max_lost, workers=workers)
+
+    def ethical_score(self, growth_factor, equity_score, sustainability_score):
+        """Vectorized score including the W-state bonus (landscape plots)."""
+        future_power = self.current_power_watts * growth_factor
+        future_k = self.calculate_kardashev(future_power)
+        k_progress = np.minimum((future_k - CURRENT_KARDASHEV) / (1.0 - CURRENT_KARDASHEV), 1.0)
+
+        score = (
+                self.weight_energy * k_progress +
+                self.weight_equity * equity_score +
+                self.weight_sustainability * sustainability_score
+        )
+        return score + self.w_state_robustness_bonus()
+
+    def scoring_params(self):
+        """Model parameters for evaluate_paths (weights, threshold, remorse link, W-state bonus)."""
+        return {
+            "current_power_watts": self.current_power_watts,
+            "weights": (self.weight_energy, self.weight_equity, self.weight_sustainability),
+            "ethical_threshold": self.ethical_threshold,
+            "base_remorse_horizon": self.base_remorse_horizon,
+            "robustness_bonus": self.w_state_robustness_bonus(),
+        }
+
+    def engine(self):
+        """This vector's scoring as a composable ScoringEngine pipeline."""
+        return ScoringEngine.from_vector(self)
+
+    def evaluate_paths_ethical(self, growth_factors, years, equity_scores=None, sustainability_scores=None,
+                               verbose=False):
+        """Batch evaluation: NumPy arrays in, record array out (real-world hints when scores are None)."""
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+
+        results = evaluate_paths(growth_factors, years, equity_scores, sustainability_scores,
+                                 **self.scoring_params())
+        if verbose:
+            print(format_evaluations(results, self.ethical_threshold))
+        return results
+
+    def evaluate_path_ethical(self, growth_factor, years, equity_score=None, sustainability_score=None,
+                              verbose=True):
+        """Single path as an Evaluation; the report is printed unless verbose=False."""
+        result = Evaluation.from_record(
+            self.evaluate_paths_ethical(growth_factor, years, equity_score, sustainability_score),
+            self.ethical_threshold)
+        if verbose:
+            print(result)
+        return result
+
+    def evaluate_regions_ethical(self, regions, growth_factors, years, equity_scores=None,
+                                 sustainability_scores=None):
+        """
+        Global guidance for (scenarios x regions) growth, with `regions` the per-region baseline
+        records of HistoricalDataset.select(year). Equity/sustainability default to each region's
+        recorded values; see pemev11.regions for the power/population aggregation. Raises
+        ValueError when only some regions have a population.
+        """
+        if equity_scores is None:
+            equity_scores = regions["equity"]
+        if sustainability_scores is None:
+            sustainability_scores = regions["sustainability"]
+        population = population_weights(regions)
+        if population is None:  # dataset without population: every region weighs the same
+            population = 1.0
+
+        params = self.scoring_params()
+        del params["current_power_watts"]
+        return evaluate_region_grid(regions["power_watts"], growth_factors, years, equity_scores,
+                                    sustainability_scores, population, **params)
+
+    def pareto_frontier(self, growth_factors, years, equity_scores=None, sustainability_scores=None,
+                        objectives=PARETO_OBJECTIVES):
+        """Non-dominated paths over future K, equity, sustainability and remorse (see pemev11.pareto)."""
+        return pareto_frontier(self.evaluate_paths_ethical(growth_factors, years, equity_scores,
+                                                           sustainability_scores), objectives)
+
+    def sensitivity(self, growth_factors, equity_scores=None, sustainability_scores=None):
+        """Exact partials of ethical_score / remorse_horizon w.r.t. inputs and weights (see pemev11.sensitivity)."""
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+        params = self.scoring_params()
+        return score_sensitivity(growth_factors, equity_scores, sustainability_scores, **params)
+
+    def recommend_probability(self, growth_factors, equity_scores=None, sustainability_scores=None,
+                              num_samples=1_000_000, seed=None, workers=1, confidence=0.95):
+        """
+        Monte Carlo probability of RECOMMEND over the random weight distribution (ignores own weights).
+        Without `seed` the run is seeded via seed_sequence() and journaled; a journal entry id
+        (str) replays that run exactly, whatever the worker count.
+        """
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+
+        if seed is None or isinstance(seed, str):
+            seed = self.seed_sequence("recommend_probability", replay=seed)
+
+        return recommend_probability(
+            growth_factors, equity_scores, sustainability_scores, num_samples=num_samples,
+            current_power_watts=self.current_power_watts,
+            ethical_threshold=self.ethical_threshold,
+            robustness_bonus=self.w_state_robustness_bonus(),
+            seed=seed, workers=workers, confidence=confidence,
+        )
+
+    def recommend_region(self, growth_factors, equity_scores=None, sustainability_scores=None):
+        """Exact weight-simplex region (polygon + area fraction) that RECOMMENDs each path (ignores own weights)."""
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+
+        return recommend_region(
+            growth_factors, equity_scores, sustainability_scores,
+            current_power_watts=self.current_power_watts,
+            ethical_threshold=self.ethical_threshold,
+            robustness_bonus=self.w_state_robustness_bonus(),
+        )
+
+    def threshold_params(self):
+        """Model parameters that define the RECOMMEND boundary."""
+        return {
+            "current_power_watts": self.current_power_watts,
+            "weights": (self.weight_energy, self.weight_equity, self.weight_sustainability),
+            "ethical_threshold": self.ethical_threshold,
+            "robustness_bonus": self.w_state_robustness_bonus(),
+        }
+
+    def min_equity_needed(self, growth_factors, sustainability_scores=None):
+        """Closed-form minimum equity for RECOMMEND (see pemev11.boundary)."""
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+        return min_equity(growth_factors, sustainability_scores, **self.threshold_params())
+
+    def min_sustainability_needed(self, growth_factors, equity_scores=None):
+        """Closed-form minimum sustainability for RECOMMEND (see pemev11.boundary)."""
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        return min_sustainability(growth_factors, equity_scores, **self.threshold_params())
+
+    def min_growth_needed(self, equity_scores=None, sustainability_scores=None):
+        """Closed-form minimum growth factor for RECOMMEND (see pemev11.boundary)."""
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+        return min_growth(equity_scores, sustainability_scores, **self.threshold_params())
+
+    def trajectory_params(self):
+        """Model parameters for year-by-year trajectories starting from today's state."""
+        return {
+            "start_equity": self.current_equity,
+            "start_sustainability": self.current_sustainability,
+            "start_year": self.current_date.year,
+            "current_power_watts": self.current_power_watts,
+            "weights": (self.weight_energy, self.weight_equity, self.weight_sustainability),
+            "ethical_threshold": self.ethical_threshold,
+            "base_remorse_horizon": self.base_remorse_horizon,
+            "robustness_bonus": self.w_state_robustness_bonus(),
+        }
+
+    def simulate_trajectories(self, growth_factors, years, equity_scores=0.8, sustainability_scores=0.8,
+                              horizon=None, curve="compound"):
+        """(paths x years) trajectories from today's hints toward each path's targets."""
+        return simulate_trajectories(growth_factors, years, equity_scores, sustainability_scores,
+                                     horizon=horizon, curve=curve, **self.trajectory_params())
+
+    def iter_trajectories(self, growth_factors, years, equity_scores=0.8, sustainability_scores=0.8,
+                          horizon=None, curve="compound", chunk_size=65536):
+        """Streaming simulate_trajectories over chunks of paths (flat memory)."""
+        return iter_trajectories(growth_factors, years, equity_scores, sustainability_scores,
+                                 horizon=horizon, chunk_size=chunk_size, curve=curve,
+                                 **self.trajectory_params())
+
+    def remorse_ledger(self, trajectories, discount_rate=0.03, window=10, level=0.0):
+        """Cumulative / worst-window remorse over simulate_trajectories output (see pemev11.remorse)."""
+        return RemorseLedger(trajectories, (self.weight_energy, self.weight_equity, self.weight_sustainability),
+                             discount_rate=discount_rate, window=window, level=level)
+
+    def score_index(self, path, growth_factors=None, years=None, equity_scores=None, sustainability_scores=None):
+        """
+        Open (or create) the sorted score index at `path` for this vector's scoring and append the
+        given paths' scores, if any. Threshold counts and flips are then binary searches.
+        """
+        params = self.scoring_params()
+        del params["ethical_threshold"]  # guidance is decided at query time
+        index = open_score_index(path, params)
+        if growth_factors is not None:
+            index.append(self.evaluate_paths_ethical(growth_factors, years, equity_scores, sustainability_scores))
+        return index
+
+    def active_seed_journal(self):
+        """Seed journal in use: the vector's own, else PEMEV11_SEED_JOURNAL (None if neither)."""
+        if isinstance(self.seed_journal, (str, os.PathLike)):
+            self.seed_journal = SeedJournal(self.seed_journal)
+        return self.seed_journal or get_default_journal()
+
+    def seed_sequence(self, purpose, replay=None, quantum=None):
+        """
+        SeedSequence for a randomized run: fresh QDay (or os.urandom) material, journaled, or the
+        journaled material of entry `replay`. The entry id is kept in seed_entry_ids[purpose].
+        """
+        journal = self.active_seed_journal()
+        if replay is not None:
+            if journal is None:
+                raise ValueError("Replaying a seed needs a seed journal (seed_journal or PEMEV11_SEED_JOURNAL)")
+            seed_seq, entry_id = journal.seed_sequence(replay), replay
+        else:
+            quantum = self.use_quantum if quantum is None else quantum
+            material, source = draw_seed_material(SEED_BYTES, quantum, self.entropy_pool)
+            if quantum and source != "qday":
+                count("seed_urandom_fallback")
+                print("Fallback to secure pseudo-random (os.urandom).")
+            entry_id = journal.record(purpose, source, material) if journal is not None else None
+            seed_seq = seed_sequence_from_bytes(material)
+        self.seed_entry_ids[purpose] = entry_id
+        return seed_seq
+
+    @instrumented("seed_weights")
+    def seed_weights_with_quantum_randomness(self, debug=True, replay=None):
+        """
+        Use QDay true quantum randomness to seed PEMEV-11 weights (sum to 1.0): three uniforms
+        from a SeedSequence over the journaled seed material, normalized. replay=<journal entry id>
+        reproduces an earlier seeding exactly, offline.
+        """
+        seed_seq = self.seed_sequence("seed_weights", replay, quantum=True)
+        weights = sample_weights(np.random.default_rng(seed_seq), 1)[:, 0]
+        self.weight_energy, self.weight_equity, self.weight_sustainability = (float(w) for w in weights)
+
+        if debug:
+            print(f"Quantum-seeded weights: Energy={self.weight_energy:.3f}, "
+                  f"Equity={self.weight_equity:.3f}, "
+                  f"Sustainability={self.weight_sustainability:.3f}")
+            if self.seed_entry_ids["seed_weights"]:
+                print(f"Seed journal entry: {self.seed_entry_ids['seed_weights']}")
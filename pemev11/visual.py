@@ -0,0 +1,137 @@
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pemev11.batch import evaluate_paths
+from pemev11 import metrics
+from pemev11.metrics import timed
+
+GROWTH_FACTORS = np.logspace(0, 4, 100)  # 1x to 10,000x
+TITLE = 'PEMEV-11 Ethical Landscape - Safe Growth Zones for Type I Transition'
+
+
+def load_pyplot():
+    """Import matplotlib lazily with the non-interactive backend (saves plots without GUI issues)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def landscape_variant(vector, path, title=TITLE):
+    """Picklable description of one landscape figure for a vector's current parameters."""
+    return {
+        "path": path,
+        "title": title,
+        "scoring": vector.scoring_params(),
+        "current_equity": vector.current_equity,
+        "current_sustainability": vector.current_sustainability,
+    }
+
+
+def landscape_curves(variant, growth_factors=GROWTH_FACTORS):
+    """High / medium / current-hint score curves for a variant."""
+    scoring = variant["scoring"]
+    return [evaluate_paths(growth_factors, 0, equity, sustainability, **scoring)["ethical_score"]
+            for equity, sustainability in ((0.95, 0.98), (0.7, 0.8),
+                                           (variant["current_equity"], variant["current_sustainability"]))]
+
+
+class LandscapeTemplate:
+    """
+    Landscape figure built once (Agg canvas, no pyplot state) and re-rendered per variant by
+    updating line data, the threshold line and the remorse-free band instead of rebuilding artists.
+    """
+
+    def __init__(self, growth_factors=GROWTH_FACTORS):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.growth_factors = growth_factors
+        self.figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(self.figure)
+        ax = self.ax = self.figure.add_subplot()
+        flat = np.zeros_like(growth_factors)
+        self.lines = [
+            ax.plot(growth_factors, flat, label='High equity/sustainability', color='green', linewidth=2)[0],
+            ax.plot(growth_factors, flat, label='Medium (improving)', color='orange', linewidth=2)[0],
+            ax.plot(growth_factors, flat, label='Current real-world hints', color='red', linewidth=2)[0],
+        ]
+        self.threshold_line = ax.axhline(0.0, color='black', linestyle='--', label='Ethical threshold')
+        self.zone = ax.fill_between(growth_factors, 0.0, 1.0, color='lightgreen', alpha=0.3, label='Remorse-free zone')
+
+        ax.set_xscale('log')
+        ax.set_xlabel('Energy Growth Factor (log scale)')
+        ax.set_ylabel('Ethical Score')
+        ax.grid(True, which="both", ls="--")
+
+    def render(self, variant):
+        """Update the artists for `variant` and save it to variant["path"]."""
+        high, medium, low = landscape_curves(variant, self.growth_factors)
+        threshold = variant["scoring"]["ethical_threshold"]
+        top = max(high.max(), medium.max(), low.max() + 0.1)
+
+        for line, curve in zip(self.lines, (high, medium, low)):
+            line.set_ydata(curve)
+        self.threshold_line.set_ydata([threshold, threshold])
+        self.threshold_line.set_label(f'Ethical threshold ({threshold})')
+        x = self.growth_factors
+        if hasattr(self.zone, "set_data"):  # FillBetweenPolyCollection, matplotlib >= 3.10
+            self.zone.set_data(x, threshold, top)
+        else:
+            self.zone.set_verts([np.column_stack([np.r_[x, x[::-1]], np.r_[np.full_like(x, threshold),
+                                                                          np.full_like(x, top)]])])
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.set_title(variant["title"])
+        self.ax.legend()
+        with timed("savefig"):
+            self.figure.savefig(variant["path"])
+        return variant["path"]
+
+
+def visualize_ethical_landscape(vector, path="ethical_landscape.png"):
+    """Plot high/medium/current-hint score curves against growth and save to `path`."""
+    load_pyplot()  # Agg backend
+    LandscapeTemplate().render(landscape_variant(vector, path))
+    print(f"Plot saved as {path}")
+    return path
+
+
+_worker_template = None
+
+
+def _init_worker():
+    global _worker_template
+    load_pyplot()
+    _worker_template = LandscapeTemplate()
+
+
+def _render_many(variants):
+    return [_worker_template.render(variant) for variant in variants]
+
+
+def render_landscapes(variants, workers=None, chunk_size=None):
+    """
+    Render many landscape variants (see landscape_variant) in a process pool.
+    Each worker builds one LandscapeTemplate and reuses it for all its figures, so N figures
+    cost one matplotlib start-up per worker rather than per figure. By default the variants are
+    split into one chunk per worker. Returns the written paths.
+    """
+    variants = list(variants)
+    workers = min(workers or os.cpu_count() or 1, max(len(variants), 1))
+    chunk_size = chunk_size or max(-(-len(variants) // workers), 1)
+    chunks = [variants[i:i + chunk_size] for i in range(0, len(variants), chunk_size)]
+    if workers == 1:
+        _init_worker()
+        return [path for chunk in chunks for path in _render_many(chunk)]
+    render = functools.partial(metrics.call_collecting, metrics.enabled(), _render_many)
+    written = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for paths, worker_metrics in pool.map(render, chunks):
+            metrics.merge(worker_metrics)
+            written += paths
+    return written
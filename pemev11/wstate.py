@@ -0,0 +1,130 @@
+import numpy as np
+
+
+def robustness_to_bonus(robustness):
+    """Bonus if robustness > 0.8 (robust): 0 to 0.2."""
+    return max(robustness - 0.8, 0.0)
+
+
+def classical_w_state_bonus(num_stakeholders=3):
+    """
+    Classical W-state amplitude simulation (normalized), kept for the original hint scripts.
+    Perfect W-state: equal distribution, survives loss of one.
+    """
+    amplitude = 1 / np.sqrt(num_stakeholders)
+    robustness = amplitude ** 2 * num_stakeholders  # ~1.0 for any N, so always the full 0.2
+    return robustness_to_bonus(robustness)
+
+
+class SparseWState:
+    """
+    W state over N stakeholder groups, |W> = sum_i a_i |0...1_i...0>, stored as its N
+    non-zero amplitudes (O(N) memory instead of a dense 2^N statevector).
+
+    Losing a set L of stakeholders leaves the mixture
+        p_L |0...0><0...0| + (1 - p_L) |W_R><W_R|,   p_L = sum_{i in L} |a_i|^2,
+    where W_R is the renormalized W state of the survivors R. Fidelity with the ideal
+    (balanced) W state on R is therefore |sum_{i in R} a_i|^2 / |R|.
+    """
+
+    def __init__(self, amplitudes):
+        amplitudes = np.asarray(amplitudes, dtype=np.complex128 if np.iscomplexobj(amplitudes) else np.float64)
+        norm = np.sqrt(np.sum(np.abs(amplitudes) ** 2))
+        if amplitudes.ndim != 1 or len(amplitudes) < 2 or norm == 0:
+            raise ValueError("A W state needs at least 2 stakeholders with non-zero amplitude")
+        self.amplitudes = amplitudes / norm
+
+    @classmethod
+    def balanced(cls, num_stakeholders):
+        """Perfect W state: equal amplitude for every stakeholder."""
+        return cls(np.full(num_stakeholders, 1 / np.sqrt(num_stakeholders)))
+
+    @classmethod
+    def from_weights(cls, stakeholder_weights):
+        """Amplitude imbalance from stakeholder shares (e.g. population): |a_i|^2 proportional to weight."""
+        return cls(np.sqrt(np.asarray(stakeholder_weights, dtype=np.float64)))
+
+    @property
+    def num_stakeholders(self):
+        return len(self.amplitudes)
+
+    @property
+    def probabilities(self):
+        """|a_i|^2: chance stakeholder i holds the single excitation."""
+        return np.abs(self.amplitudes) ** 2
+
+    def fidelity(self, other):
+        """|<self|other>|^2 between two W states on the same stakeholders."""
+        return float(np.abs(np.vdot(self.amplitudes, other.amplitudes)) ** 2)
+
+    def ideal_fidelity(self):
+        """Fidelity with the balanced W state (1.0 only for perfectly equal amplitudes)."""
+        return float(np.abs(self.amplitudes.sum()) ** 2 / self.num_stakeholders)
+
+    def after_loss(self, lost):
+        """
+        (collapse probability p_L, survivors' SparseWState or None) after losing stakeholders
+        `lost` (boolean mask or index array).
+        """
+        mask = np.zeros(self.num_stakeholders, dtype=bool)
+        mask[lost] = True
+        collapse = float(self.probabilities[mask].sum())
+        survivors = self.amplitudes[~mask]
+        if len(survivors) < 2 or collapse >= 1.0:
+            return collapse, None
+        return collapse, SparseWState(survivors)
+
+    def loss_fidelity(self, lost=None):
+        """
+        Fidelity of the post-loss state with the ideal W state on the survivors.
+        Without `lost`: vector over every single-stakeholder loss k, in O(N) total.
+        """
+        if lost is None:
+            total = self.amplitudes.sum()
+            return np.abs(total - self.amplitudes) ** 2 / (self.num_stakeholders - 1)
+        mask = np.zeros(self.num_stakeholders, dtype=bool)
+        mask[lost] = True
+        remaining = int((~mask).sum())
+        if remaining < 2:
+            return 0.0
+        return float(np.abs(self.amplitudes[~mask].sum()) ** 2 / remaining)
+
+    def pairwise_concurrence(self, lost=None):
+        """
+        Mean concurrence 2|a_i||a_j| over surviving pairs (tracing out others leaves pair
+        entanglement unchanged). Computed in O(N) from sums instead of over all pairs.
+        """
+        magnitudes = np.abs(self.amplitudes)
+        if lost is not None:
+            mask = np.zeros(self.num_stakeholders, dtype=bool)
+            mask[lost] = True
+            magnitudes = magnitudes[~mask]
+        n = len(magnitudes)
+        if n < 2:
+            return 0.0
+        pair_sum = (magnitudes.sum() ** 2 - (magnitudes ** 2).sum()) / 2
+        return float(2 * pair_sum / (n * (n - 1) / 2))
+
+    def expected_loss_fidelity(self, loss_probabilities=None):
+        """
+        Robustness: expected post-loss fidelity when exactly one stakeholder is lost,
+        stakeholder k with probability loss_probabilities[k] (default: uniform).
+        """
+        fidelities = self.loss_fidelity()
+        if loss_probabilities is None:
+            return float(fidelities.mean())
+        weights = np.asarray(loss_probabilities, dtype=np.float64)
+        return float(np.dot(weights, fidelities) / weights.sum())
+
+    def robustness_bonus(self, loss_probabilities=None):
+        """Score bonus from the genuine loss robustness (0 to 0.2)."""
+        return robustness_to_bonus(self.expected_loss_fidelity(loss_probabilities))
+
+
+def w_state_bonus(num_stakeholders=3, stakeholder_weights=None, loss_probabilities=None):
+    """Robustness bonus from the sparse W-state model of the stakeholder groups."""
+    if stakeholder_weights is not None:
+        state = SparseWState.from_weights(stakeholder_weights)
+    else:
+        state = SparseWState.balanced(num_stakeholders)
+    return state.robustness_bonus(loss_probabilities)
@@ -56,11 +56,15 @@ class PlanetaryEnergyMasteryEthicalVector:
 
 
 # Run it
-vector = PlanetaryEnergyMasteryEthicalVector()
-"C:\Users\marun\OneDrive\Υπολογιστής QERRA- PEMEV- 11\.venv\Scripts\python.exe" "C:\Users\marun\OneDrive\Υπολογιστής QERRA- PEMEV- 11\pemev11_baseline.py"
-PEMEV-11 Baseline - 2025-12-29
-Current energy use: 2.30e+13 W
-Type I target: 1.74e+17 W
-Energy gap: ~7565x needed
-Current Kardashev: 0.736 (~0.73)
-Progress to Type I: 73.6%
\ No newline at end of file
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
+
+    # Example run:
+    # "C:\Users\marun\OneDrive\Υπολογιστής QERRA- PEMEV- 11\.venv\Scripts\python.exe" "C:\Users\marun\OneDrive\Υπολογιστής QERRA- PEMEV- 11\pemev11_baseline.py"
+    # PEMEV-11 Baseline - 2025-12-29
+    # Current energy use: 2.30e+13 W
+    # Type I target: 1.74e+17 W
+    # Energy gap: ~7565x needed
+    # Current Kardashev: 0.736 (~0.73)
+    # Progress to Type I: 73.6%
@@ -1,6 +1,8 @@
 import numpy as np
 import datetime
 
+from pemev11.batch import evaluate_paths, format_evaluations
+
 
 class PlanetaryEnergyMasteryEthicalVector:
     """
@@ -66,15 +68,30 @@ class PlanetaryEnergyMasteryEthicalVector:
         print(f"Ethical score: {ethical_score:.3f} | Remorse horizon: {remorse_horizon:.2f}")
         print(f"Guidance: {guidance}")
 
+    def evaluate_paths_ethical(self, growth_factors, years, equity_scores=0.8, sustainability_scores=0.8,
+                               verbose=False):
+        """Batch version of evaluate_path_ethical: NumPy arrays in, record array out."""
+        results = evaluate_paths(
+            growth_factors, years, equity_scores, sustainability_scores,
+            current_power_watts=self.current_power_watts,
+            weights=(self.weight_energy, self.weight_equity, self.weight_sustainability),
+            ethical_threshold=self.ethical_threshold,
+            base_remorse_horizon=self.base_remorse_horizon,
+        )
+        if verbose:
+            print(format_evaluations(results, self.ethical_threshold))
+        return results
+
 
 # Run everything
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.print_baseline()
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
 
-vector.evaluate_current_state()
+    vector.evaluate_current_state()
 
-print("\nBalanced improved path:")
-vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
+    print("\nBalanced improved path:")
+    vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
 
-print("\nFast breakthrough improved:")
-vector.evaluate_path_ethical(growth_factor=5000, years=25, equity_score=0.92, sustainability_score=0.95)
\ No newline at end of file
+    print("\nFast breakthrough improved:")
+    vector.evaluate_path_ethical(growth_factor=5000, years=25, equity_score=0.92, sustainability_score=0.95)
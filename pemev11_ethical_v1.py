@@ -31,15 +31,16 @@ class PlanetaryEnergyMasteryEthicalVector:
         print(f"Energy gap: ~{gap:.0f}x\n")
 
 # Run baseline
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.print_baseline()
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
 
-# Ethical guidance tests
-print("Balanced path — high equity & sustainability:")
-vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
+    # Ethical guidance tests
+    print("Balanced path — high equity & sustainability:")
+    vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
 
-print("\nRisky path — rapid growth but low equity & sustainability:")
-vector.evaluate_path_ethical(growth_factor=2000, years=40, equity_score=0.5, sustainability_score=0.6)
+    print("\nRisky path — rapid growth but low equity & sustainability:")
+    vector.evaluate_path_ethical(growth_factor=2000, years=40, equity_score=0.5, sustainability_score=0.6)
 
 
 def evaluate_path_ethical(self, growth_factor, years, equity_score=0.8, sustainability_score=0.8):
@@ -78,4 +79,4 @@ def evaluate_path_ethical(self, growth_factor, years, equity_score=0.8, sustaina
     vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
 
     print("\nRisky path (rapid growth, low equity/sustainability):")
-    vector.evaluate_path_ethical(growth_factor=2000, years=40, equity_score=0.5, sustainability_score=0.6)
\ No newline at end of file
+    vector.evaluate_path_ethical(growth_factor=2000, years=40, equity_score=0.5, sustainability_score=0.6)
@@ -1,11 +1,14 @@
 import numpy as np
 import datetime
-import requests
 import struct
 import os  # safer fallback
 
+from pemev11.batch import evaluate_paths, format_evaluations
+
 def fetch_quantum_random_bytes(num_bytes: int = 32) -> bytes:
     """Fetch true quantum random bytes from QDay API with validation."""
+    import requests  # lazy: only paid when quantum seeding is actually used
+
     QDAY_URL = "https://qday.dev/v1/bytes"
     params = {"length": num_bytes}
     headers = {"User-Agent": "PEMEV11-QAI-Project-Marussa"}  # polite + identifiable
@@ -85,6 +88,20 @@ class PlanetaryEnergyMasteryEthicalVector:
         print(f"Ethical score: {ethical_score:.3f} (threshold {self.ethical_threshold})")
         print(f"Guidance: {guidance}\n")
 
+    def evaluate_paths_ethical(self, growth_factors, years, equity_scores=0.8, sustainability_scores=0.8,
+                               verbose=False):
+        """Batch version of evaluate_path_ethical: NumPy arrays in, record array out."""
+        results = evaluate_paths(
+            growth_factors, years, equity_scores, sustainability_scores,
+            current_power_watts=self.current_power_watts,
+            weights=(self.weight_energy, self.weight_equity, self.weight_sustainability),
+            ethical_threshold=self.ethical_threshold,
+            base_remorse_horizon=None,
+        )
+        if verbose:
+            print(format_evaluations(results, self.ethical_threshold))
+        return results
+
     def seed_weights_with_quantum_randomness(self, debug=True):
         """Use QDay true quantum randomness to seed PEMEV-11 weights (sum to 1.0)."""
         random_bytes = fetch_quantum_random_bytes(num_bytes=24)
@@ -1,11 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import datetime
 
-# Non-interactive backend — saves plot without GUI issues
-import matplotlib
-
-matplotlib.use('Agg')
+from pemev11.visual import load_pyplot
 
 
 class PlanetaryEnergyMasteryEthicalVector:
@@ -58,6 +54,7 @@ class PlanetaryEnergyMasteryEthicalVector:
         return score + robustness_bonus
 
     def visualize_ethical_landscape(self):
+        plt = load_pyplot()  # lazy, non-interactive Agg backend
         growth_factors = np.logspace(0, 4, 100)  # 1x to 10,000x
 
         high = self.ethical_score(growth_factors, 0.95, 0.98)
@@ -86,6 +83,7 @@ class PlanetaryEnergyMasteryEthicalVector:
 
 
 # Run everything
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.print_baseline()
-vector.visualize_ethical_landscape()
\ No newline at end of file
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
+    vector.visualize_ethical_landscape()
@@ -67,14 +67,15 @@ class PlanetaryEnergyMasteryEthicalVector:
 
 
 # Run everything
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.print_baseline()
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
 
-print("Current real-world hint path (no change):")
-vector.evaluate_path_ethical(growth_factor=1, years=0)
+    print("Current real-world hint path (no change):")
+    vector.evaluate_path_ethical(growth_factor=1, years=0)
 
-print("\nBalanced improved path:")
-vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
+    print("\nBalanced improved path:")
+    vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
 
-print("\nFast breakthrough with real hints improved:")
-vector.evaluate_path_ethical(growth_factor=5000, years=25, equity_score=0.85, sustainability_score=0.90)
\ No newline at end of file
+    print("\nFast breakthrough with real hints improved:")
+    vector.evaluate_path_ethical(growth_factor=5000, years=25, equity_score=0.85, sustainability_score=0.90)
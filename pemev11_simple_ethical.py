@@ -55,11 +55,12 @@ class PlanetaryEnergyMasteryEthicalVector:
 
 
 # Run everything
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.print_baseline()
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
 
-print("Balanced path — high equity & sustainability:")
-vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
+    print("Balanced path — high equity & sustainability:")
+    vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
 
-print("Risky path — rapid growth but low equity & sustainability:")
-vector.evaluate_path_ethical(growth_factor=2000, years=40, equity_score=0.5, sustainability_score=0.6)
\ No newline at end of file
+    print("Risky path — rapid growth but low equity & sustainability:")
+    vector.evaluate_path_ethical(growth_factor=2000, years=40, equity_score=0.5, sustainability_score=0.6)
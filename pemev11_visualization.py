@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import datetime
 
 
@@ -43,6 +42,8 @@ class PlanetaryEnergyMasteryEthicalVector:
         return score + robustness_bonus
 
     def visualize_ethical_landscape(self):
+        import matplotlib.pyplot as plt  # lazy: plotting only
+
         growth_factors = np.logspace(0, 4, 100)  # 1x to 10,000x
 
         # Three scenarios
@@ -69,5 +70,6 @@ class PlanetaryEnergyMasteryEthicalVector:
 
 
 # Run visualization
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.visualize_ethical_landscape()
\ No newline at end of file
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.visualize_ethical_landscape()
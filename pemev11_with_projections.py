@@ -45,15 +45,16 @@ class PlanetaryEnergyMasteryEthicalVector:
 
 
 # Run everything
-vector = PlanetaryEnergyMasteryEthicalVector()
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
 
-vector.print_baseline()
+    vector.print_baseline()
 
-print("\nOptimistic near-term (e.g., renewables + early fusion):")
-vector.project_future(growth_factor=10, years=20)
+    print("\nOptimistic near-term (e.g., renewables + early fusion):")
+    vector.project_future(growth_factor=10, years=20)
 
-print("\nMid-century with fusion + orbital solar + Mars ISRU:")
-vector.project_future(growth_factor=1000, years=50)
+    print("\nMid-century with fusion + orbital solar + Mars ISRU:")
+    vector.project_future(growth_factor=1000, years=50)
 
-print("\nFull Type I mastery path:")
-vector.project_future(growth_factor=7570, years=100)
\ No newline at end of file
+    print("\nFull Type I mastery path:")
+    vector.project_future(growth_factor=7570, years=100)
@@ -1,6 +1,8 @@
 import numpy as np
 import datetime
 
+from pemev11.batch import evaluate_paths, format_evaluations
+
 
 class PlanetaryEnergyMasteryEthicalVector:
     """
@@ -83,15 +85,36 @@ class PlanetaryEnergyMasteryEthicalVector:
         print(f"Ethical score: {ethical_score:.3f} | Remorse horizon: {remorse_horizon:.2f}")
         print(f"Guidance: {guidance}")
 
+    def evaluate_paths_ethical(self, growth_factors, years, equity_scores=None, sustainability_scores=None,
+                               verbose=False):
+        """Batch version of evaluate_path_ethical: NumPy arrays in, record array out."""
+        if equity_scores is None:
+            equity_scores = self.current_equity
+        if sustainability_scores is None:
+            sustainability_scores = self.current_sustainability
+
+        results = evaluate_paths(
+            growth_factors, years, equity_scores, sustainability_scores,
+            current_power_watts=self.current_power_watts,
+            weights=(self.weight_energy, self.weight_equity, self.weight_sustainability),
+            ethical_threshold=self.ethical_threshold,
+            base_remorse_horizon=self.base_remorse_horizon,
+            robustness_bonus=self.w_state_robustness_bonus(),
+        )
+        if verbose:
+            print(format_evaluations(results, self.ethical_threshold))
+        return results
+
 
 # Run everything
-vector = PlanetaryEnergyMasteryEthicalVector()
-vector.print_baseline()
+if __name__ == "__main__":
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    vector.print_baseline()
 
 
 
-print("\nBalanced path with robustness:")
-vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
+    print("\nBalanced path with robustness:")
+    vector.evaluate_path_ethical(growth_factor=1000, years=50, equity_score=0.95, sustainability_score=0.98)
 
-print("\nFast path with robustness:")
-vector.evaluate_path_ethical(growth_factor=5000, years=25, equity_score=0.92, sustainability_score=0.95)
\ No newline at end of file
+    print("\nFast path with robustness:")
+    vector.evaluate_path_ethical(growth_factor=5000, years=25, equity_score=0.92, sustainability_score=0.95)
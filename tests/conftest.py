@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Run the suite against the checkout, not an installed copy
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
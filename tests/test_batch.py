@@ -0,0 +1,56 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from pemev11.batch import CURRENT_KARDASHEV, EVALUATION_BLOCK, evaluate_paths
+
+
+@pytest.mark.parametrize("base_remorse_horizon", [-1.0, None])
+@pytest.mark.parametrize("k_progress_cap", [1.0, None])
+def test_evaluate_paths_matches_formula(base_remorse_horizon, k_progress_cap):
+    rng = np.random.default_rng(1)
+    growth, years, equity, sustainability = 10 ** rng.uniform(0, 4, 1000), 50.0, rng.random(1000), rng.random(1000)
+    result = evaluate_paths(growth, years, equity, sustainability, base_remorse_horizon=base_remorse_horizon,
+                            k_progress_cap=k_progress_cap, robustness_bonus=0.01)
+
+    future_k = (np.log10(2.3e13 * growth) - 6) / 10
+    k_progress = (future_k - CURRENT_KARDASHEV) / (1 - CURRENT_KARDASHEV)
+    if k_progress_cap is not None:
+        k_progress = np.minimum(k_progress, k_progress_cap)
+    score = 0.3 * k_progress + 0.4 * equity + 0.3 * sustainability + 0.01
+    np.testing.assert_allclose(result["future_k"], future_k)
+    np.testing.assert_allclose(result["k_progress"], k_progress)
+    np.testing.assert_allclose(result["ethical_score"], score)
+    if base_remorse_horizon is None:
+        assert np.isnan(result["remorse_horizon"]).all()
+    else:
+        np.testing.assert_allclose(result["remorse_horizon"], base_remorse_horizon + 1 - score)
+    np.testing.assert_array_equal(result["guidance"], score >= 0.95)
+
+
+def test_evaluate_paths_scalar_and_broadcast():
+    assert evaluate_paths(1000, 50, 0.9, 0.9).shape == ()
+    assert evaluate_paths([[1.0], [10.0]], [1, 2, 3], 0.9, 0.9).shape == (2, 3)
+
+
+def test_evaluate_paths_allocates_only_result_and_block_scratch():
+    rng = np.random.default_rng(2)
+    n = 1_000_000
+    growth, equity, sustainability = 10 ** rng.uniform(0, 4, n), rng.random(n), rng.random(n)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = evaluate_paths(growth, 50.0, equity, sustainability)
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    assert peak <= result.nbytes + 2 * EVALUATION_BLOCK * 8 + 256 * 1024  # slack: ufunc casting buffers
+
+
+def test_evaluate_paths_across_blocks():
+    growth = 10 ** np.linspace(0, 4, 2 * EVALUATION_BLOCK + 7)
+    blocked = evaluate_paths(growth, 50.0, 0.9, 0.8)
+    single = np.concatenate([evaluate_paths(g, 50.0, 0.9, 0.8)[None] for g in growth[::9973]])
+    np.testing.assert_array_equal(blocked[::9973], single)
+    assert evaluate_paths(np.empty(0), 1.0, 1.0, 1.0).shape == (0,)
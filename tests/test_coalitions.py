@@ -0,0 +1,58 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from pemev11.coalitions import coalition_loss_distribution
+from pemev11.wstate import SparseWState
+
+
+def _bonus(amplitudes, lost):
+    survivors = len(amplitudes) - lost.sum()
+    fidelity = abs(amplitudes[~lost].sum()) ** 2 / survivors if survivors >= 2 else 0.0
+    return max(fidelity - 0.8, 0.0)
+
+
+def _brute_force(amplitudes, loss_probabilities, max_lost):
+    n = len(amplitudes)
+    expected_bonus = expected_fidelity = total = 0.0
+    worst = (np.inf, None)
+    for lost in itertools.product((False, True), repeat=n):
+        lost = np.array(lost)
+        probability = np.prod(np.where(lost, loss_probabilities, 1 - loss_probabilities))
+        survivors = n - lost.sum()
+        fidelity = abs(amplitudes[~lost].sum()) ** 2 / survivors if survivors >= 2 else 0.0
+        bonus = _bonus(amplitudes, lost)
+        total += probability
+        expected_bonus += probability * bonus
+        expected_fidelity += probability * fidelity
+        if probability > 0 and lost.sum() <= max_lost and bonus < worst[0]:
+            worst = (bonus, list(np.flatnonzero(lost)))
+    return expected_bonus / total, expected_fidelity / total, worst
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_gray_code_enumeration_matches_brute_force(workers):
+    rng = np.random.default_rng(5)
+    amplitudes = SparseWState(rng.uniform(0.9, 1.1, 8)).amplitudes
+    loss_probabilities = rng.uniform(0.05, 0.5, 8)
+    result = coalition_loss_distribution(amplitudes, loss_probabilities, max_lost=1, workers=workers, low_bits=3)
+
+    expected_bonus, expected_fidelity, (worst_bonus, worst_lost) = _brute_force(amplitudes, loss_probabilities, 1)
+    assert result["expected_bonus"] == pytest.approx(expected_bonus)
+    assert result["expected_fidelity"] == pytest.approx(expected_fidelity)
+    assert result["worst_bonus"] == pytest.approx(worst_bonus)
+    assert worst_bonus > 0  # single losses keep F > 0.8, so the worst case is unique
+    assert result["worst_lost"] == worst_lost
+    assert result["bonus_histogram"].sum() == pytest.approx(1.0)
+
+
+def test_workers_agree():
+    rng = np.random.default_rng(6)
+    amplitudes, loss_probabilities = rng.uniform(0.5, 1.5, 12), rng.uniform(0.0, 0.3, 12)
+    serial = coalition_loss_distribution(amplitudes, loss_probabilities, workers=1, low_bits=4)
+    parallel = coalition_loss_distribution(amplitudes, loss_probabilities, workers=4, low_bits=4)
+    for key in ("expected_bonus", "expected_fidelity", "worst_bonus", "probability_mass"):
+        assert parallel[key] == pytest.approx(serial[key])
+    assert parallel["worst_lost"] == serial["worst_lost"]
+    np.testing.assert_allclose(parallel["bonus_histogram"], serial["bonus_histogram"])
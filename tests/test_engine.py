@@ -0,0 +1,11 @@
+import pytest
+
+from pemev11.engine import Stage
+
+
+def test_incomplete_stage_fails_at_construction():
+    class NoConfigure(Stage):
+        pass
+
+    with pytest.raises(TypeError, match="configure"):
+        NoConfigure()
@@ -0,0 +1,10 @@
+from pemev11.bench import IMPORT_BUDGET_MS, LAZY_MODULES, measure_cold_import
+
+from conftest import ROOT
+
+
+def test_cold_import_within_budget(monkeypatch):
+    monkeypatch.chdir(ROOT)  # the probe interpreter imports pemev11 from the working directory
+    elapsed, loaded = measure_cold_import()
+    assert not loaded, f"{', '.join(loaded)} imported eagerly (must stay lazy: {', '.join(LAZY_MODULES)})"
+    assert elapsed <= IMPORT_BUDGET_MS, f"cold import took {elapsed:.1f} ms (budget {IMPORT_BUDGET_MS} ms)"
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from pemev11.batch import evaluate_paths
+from pemev11.landscape import build_landscape_grid
+from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+
+
+def test_grid_matches_evaluate_paths(tmp_path):
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    grid = build_landscape_grid(vector, str(tmp_path), (20, 5, 5), dtype="float64", tile_size=8)
+    growth, equity, sustainability = np.meshgrid(*grid.axes.values(), indexing="ij")
+    params = vector.scoring_params()
+    expected = evaluate_paths(growth, 50, equity, sustainability, **params)
+    np.testing.assert_allclose(grid._open("ethical_score", "r"), expected["ethical_score"])
+    np.testing.assert_allclose(grid._open("remorse_horizon", "r"), expected["remorse_horizon"])
+
+
+@pytest.mark.parametrize("change", [{"growth_range": (10.0, 1e6)}, {"dtype": "float64"}, {"tile_size": 4}])
+def test_resume_rejects_different_build(tmp_path, change):
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    build_landscape_grid(vector, str(tmp_path), (20, 5, 5), tile_size=8)
+    build_landscape_grid(vector, str(tmp_path), (20, 5, 5), tile_size=8)  # same build resumes
+    with pytest.raises(ValueError, match=next(iter(change))):
+        build_landscape_grid(vector, str(tmp_path), (20, 5, 5), **{"tile_size": 8, **change})
@@ -0,0 +1,62 @@
+from pemev11 import metrics
+
+
+def test_prometheus_families_are_contiguous():
+    metrics.enable()
+    try:
+        metrics.reset()
+        metrics.observe("a", 0.001, batch_size=10)
+        metrics.observe("b", 0.002, error=True)
+        text = metrics.prometheus_text()
+    finally:
+        metrics.enable(False)
+        metrics.reset()
+
+    families = []
+    for line in text.splitlines():
+        family = line.split()[2] if line.startswith("# TYPE") else line.split("{")[0]
+        for suffix in ("_bucket", "_sum", "_count"):
+            family = family[:-len(suffix)] if family.endswith(suffix) else family
+        if not families or families[-1] != family:
+            families.append(family)
+    assert len(families) == len(set(families)), families
+    assert 'le="2.5e-06"' in text
+
+
+def test_worker_metrics_are_merged(tmp_path):
+    from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+    from pemev11.visual import landscape_variant, render_landscapes
+
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    variants = [landscape_variant(vector, str(tmp_path / f"v{i}.png")) for i in range(3)]
+    metrics.enable()
+    try:
+        metrics.reset()
+        metrics.observe("savefig", 0.5)  # recorded before the pool starts; forked workers must not resend it
+        render_landscapes(variants, workers=3)
+        data = metrics.snapshot()
+    finally:
+        metrics.enable(False)
+        metrics.reset()
+    savefig = data["operations"]["savefig"]
+    assert savefig["calls"] == 4
+    assert savefig["latency_seconds"]["count"] == 4
+    assert savefig["latency_seconds"]["cumulative_counts"][-1] == 4
+
+
+def test_merge_adds_snapshots():
+    metrics.enable()
+    try:
+        metrics.reset()
+        metrics.observe("op", 0.001, batch_size=10)
+        metrics.count("event", 2)
+        data = metrics.snapshot()
+        metrics.merge(data)
+        merged = metrics.snapshot()
+    finally:
+        metrics.enable(False)
+        metrics.reset()
+    assert merged["operations"]["op"]["calls"] == 2
+    assert merged["operations"]["op"]["batch_size"]["cumulative_counts"] == [
+        2 * count for count in data["operations"]["op"]["batch_size"]["cumulative_counts"]]
+    assert merged["counters"] == {"event": 4}
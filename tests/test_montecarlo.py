@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from pemev11.montecarlo import SAMPLE_BLOCK, recommend_probability
+from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+
+GROWTH = [1.0, 30.0, 1000.0]
+
+
+def test_counts_independent_of_workers_and_chunking():
+    seed = np.random.SeedSequence(1234)
+    reference = recommend_probability(GROWTH, 0.9, 0.97, num_samples=3 * SAMPLE_BLOCK + 100, seed=seed)
+    for kwargs in ({"workers": 4}, {"sample_chunk": 1000}, {"workers": 2, "sample_chunk": 333, "path_chunk": 2}):
+        result = recommend_probability(GROWTH, 0.9, 0.97, num_samples=3 * SAMPLE_BLOCK + 100, seed=seed, **kwargs)
+        np.testing.assert_array_equal(result["recommend_count"], reference["recommend_count"])
+    assert 0 < reference["recommend_count"][2] < 3 * SAMPLE_BLOCK + 100
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_journal_replay_is_exact_for_any_worker_count(tmp_path, workers):
+    vector = PlanetaryEnergyMasteryEthicalVector(seed_journal=str(tmp_path / "seeds.jsonl"))
+    original = vector.recommend_probability(GROWTH, 0.9, 0.97, num_samples=20_000)
+    entry_id = vector.seed_entry_ids["recommend_probability"]
+
+    replayed = vector.recommend_probability(GROWTH, 0.9, 0.97, num_samples=20_000, seed=entry_id, workers=workers)
+    np.testing.assert_array_equal(replayed, original)
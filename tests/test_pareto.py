@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from pemev11.batch import evaluate_paths
+from pemev11.pareto import iter_pareto_frontier, pareto_frontier, pareto_mask
+
+
+def _brute_force(points):
+    at_least = (points[None, :, :] >= points[:, None, :]).all(axis=2)  # [p, q]: q >= p everywhere
+    better = (points[None, :, :] > points[:, None, :]).any(axis=2)
+    return ~(at_least & better).any(axis=1)
+
+
+@pytest.mark.parametrize("dims", [1, 2, 3, 4, 5])  # 2D sweep, 3D divide and conquer, SFS for 4+
+@pytest.mark.parametrize("seed", range(20))
+def test_pareto_mask_matches_brute_force(dims, seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 300))
+    if seed % 3 == 0:
+        points = rng.integers(0, 4, (n, dims)).astype(float)  # ties and duplicate rows
+    elif seed % 3 == 1:
+        points = rng.random((n, dims))
+        points[:, -1] = 1 - points[:, :-1].sum(axis=1) / max(dims - 1, 1) if dims > 1 else points[:, -1]
+    else:
+        points = rng.normal(size=(n, dims))
+    np.testing.assert_array_equal(pareto_mask(points), _brute_force(points))
+
+
+def test_streaming_frontier_matches_whole_array():
+    rng = np.random.default_rng(3)
+    results = evaluate_paths(10 ** rng.uniform(0, 4, 5000), 50.0, rng.random(5000), rng.random(5000))
+    expected = np.sort(pareto_frontier(results), order=["growth_factor", "equity"])
+    chunks = (results[i:i + 700] for i in range(0, len(results), 700))
+    streamed = np.concatenate(list(iter_pareto_frontier(chunks)))
+    np.testing.assert_array_equal(np.sort(streamed, order=["growth_factor", "equity"]), expected)
+
+
+@pytest.mark.parametrize("dims", [3, 4])
+def test_pareto_mask_large_anticorrelated(dims):
+    rng = np.random.default_rng(dims)
+    points = rng.dirichlet(np.ones(dims), 2500) + rng.normal(scale=0.01, size=(2500, dims))
+    np.testing.assert_array_equal(pareto_mask(points), _brute_force(points))
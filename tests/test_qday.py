@@ -0,0 +1,74 @@
+import http.server
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pemev11.qday import QDayEntropyPool
+from pemev11.seeding import draw_seed_material
+
+
+class _StandIn(http.server.BaseHTTPRequestHandler):
+    """Local /v1/bytes: hex of `length` random bytes, or HTTP 503 while the server is failing."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.server.failing:
+            self.send_error(503)
+            return
+        length = int(parse_qs(urlparse(self.path).query)["length"][0])
+        body = os.urandom(length).hex().encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    httpd.failing, httpd.requests = False, 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _pool(server, **kwargs):
+    return QDayEntropyPool(f"http://127.0.0.1:{server.server_address[1]}/v1/bytes", block_size=256,
+                           low_water=64, timeout=1.0, **kwargs)
+
+
+def test_refill_and_take(server):
+    with _pool(server) as pool:
+        assert len(pool.take(24)) == 24
+        requests = server.requests
+        for _ in range(5):  # served from the prefetched block, no round trip each
+            assert len(pool.take(24)) == 24
+        assert server.requests <= requests + 1
+        assert draw_seed_material(32, pool=pool)[1] == "qday"
+
+
+def test_breaker_opens_falls_back_and_resets(server):
+    server.failing = True
+    with _pool(server, failure_threshold=3, reset_after=0.3) as pool:
+        assert pool.take(24, wait=2.0) == b""
+        assert pool.circuit_open
+        assert server.requests == 3
+
+        start = time.monotonic()
+        material, source = draw_seed_material(32, pool=pool)
+        assert (len(material), source) == (32, "urandom")
+        assert time.monotonic() - start < 0.1  # open breaker: no network wait
+        assert server.requests == 3
+
+        server.failing = False
+        time.sleep(0.35)
+        assert not pool.circuit_open
+        assert len(pool.take(24)) == 24
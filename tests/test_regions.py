@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from pemev11.batch import evaluate_paths
+from pemev11.history import HISTORY_DTYPE, HistoricalDataset
+from pemev11.regions import evaluate_regions
+from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+
+
+def _records(population):
+    records = np.zeros(3, dtype=HISTORY_DTYPE)
+    records["year"] = 2020
+    records["region"] = [0, 1, 2]
+    records["power_watts"] = [1e13, 8e12, 5e12]
+    records["equity"] = [0.9, 0.5, 0.3]
+    records["sustainability"] = [0.8, 0.6, 0.4]
+    records["population"] = population
+    return records
+
+
+def test_segment_sums_match_per_scenario_reference():
+    rng = np.random.default_rng(4)
+    scenario = rng.integers(0, 20, 300) * 7
+    power, growth = rng.uniform(1e11, 1e13, 300), 10 ** rng.uniform(0, 3, 300)
+    equity, sustainability, population = rng.random(300), rng.random(300), rng.uniform(1, 100, 300)
+    result = evaluate_regions(scenario, power, growth, 50.0, equity, sustainability, population)
+
+    for row in result:
+        rows = scenario == row["scenario"]
+        expected = evaluate_paths(
+            (power[rows] * growth[rows]).sum() / power[rows].sum(), 50.0,
+            np.average(equity[rows], weights=population[rows]),
+            np.average(sustainability[rows], weights=population[rows]),
+            current_power_watts=power[rows].sum())
+        assert row["num_regions"] == rows.sum()
+        assert row["ethical_score"] == pytest.approx(float(expected["ethical_score"]))
+
+
+def test_partial_population_is_rejected(tmp_path):
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    with pytest.raises(ValueError, match="region"):
+        vector.evaluate_regions_ethical(_records([1e9, np.nan, 2e8]), [[2.0, 2.0, 2.0]], 50)
+
+    dataset = HistoricalDataset.create(str(tmp_path), _records([1e9, np.nan, 2e8]), ["a", "b", "c"])
+    with pytest.raises(ValueError, match="b"):
+        dataset.snapshot(2020)
+
+
+def test_population_weighting():
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    weighted = vector.evaluate_regions_ethical(_records([1e9, 1.0, 1.0]), [[1.0, 1.0, 1.0]], 50)
+    assert weighted["equity"][0] == pytest.approx(0.9, abs=1e-6)
+    unweighted = vector.evaluate_regions_ethical(_records(np.nan), [[1.0, 1.0, 1.0]], 50)
+    assert unweighted["equity"][0] == pytest.approx(np.mean([0.9, 0.5, 0.3]))
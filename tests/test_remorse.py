@@ -0,0 +1,43 @@
+import numpy as np
+
+from pemev11.remorse import RemorseLedger
+from pemev11.trajectory import simulate_trajectories
+
+
+def _rebuilt(trajectories, paths, year_index, equity, sustainability):
+    revised = trajectories.copy()
+    for path, year, new_equity, new_sustainability in zip(paths, year_index, equity, sustainability):
+        revised[path, year]["equity"] = new_equity
+        revised[path, year]["sustainability"] = new_sustainability
+    score = 0.3 * revised["k_progress"] + 0.4 * revised["equity"] + 0.3 * revised["sustainability"]
+    revised["remorse_horizon"] = -score  # base_remorse_horizon -1.0
+    return RemorseLedger(revised, window=5)
+
+
+def test_incremental_update_matches_rebuild_with_duplicates():
+    rng = np.random.default_rng(7)
+    trajectories = simulate_trajectories(10 ** rng.uniform(0, 4, 50), rng.uniform(10, 60, 50),
+                                         rng.random(50), rng.random(50), horizon=30)
+    ledger = RemorseLedger(trajectories, window=5)
+
+    paths = np.concatenate([[3, 3, 3], rng.integers(0, 50, 200)])
+    year_index = np.concatenate([[5, 5, 5], rng.integers(0, 31, 200)])
+    equity, sustainability = rng.random(len(paths)), rng.random(len(paths))
+    ledger.update(paths[:100], year_index[:100], equity[:100], sustainability[:100])
+    ledger.update(paths[100:], year_index[100:], equity=equity[100:], sustainability=sustainability[100:])
+
+    expected = _rebuilt(trajectories, paths, year_index, equity, sustainability)
+    np.testing.assert_allclose(ledger.remorse, expected.remorse)
+    np.testing.assert_allclose(ledger.cumulative, expected.cumulative)
+    summary, expected_summary = ledger.summary(), expected.summary()
+    for name in summary.dtype.names:
+        np.testing.assert_allclose(summary[name], expected_summary[name], equal_nan=True)
+
+
+def test_duplicate_revision_keeps_last_value():
+    trajectories = simulate_trajectories([100.0] * 5, 20.0, 0.8, 0.8, horizon=20)
+    ledger = RemorseLedger(trajectories, window=5)
+    ledger.update([3, 3], [5, 5], equity=[0.1, 0.9])
+    expected = _rebuilt(trajectories, [3], [5], [0.9], [trajectories[3, 5]["sustainability"]])
+    np.testing.assert_allclose(ledger.summary()["discounted_remorse"], expected.summary()["discounted_remorse"])
+    assert ledger.equity[3, 5] == 0.9
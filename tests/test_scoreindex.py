@@ -0,0 +1,48 @@
+import numpy as np
+
+from pemev11.scoreindex import ScoreIndex, merge_runs, open_score_index
+
+
+def test_merge_runs_matches_sort():
+    rng = np.random.default_rng(0)
+    older = np.sort(rng.integers(0, 50, 300).astype(float))
+    newer = np.sort(rng.integers(0, 50, 120).astype(float))
+    scores, ids = merge_runs((older, np.arange(300)), (newer, np.arange(300, 420)))
+    order = np.argsort(np.concatenate([older, newer]), kind="stable")
+    np.testing.assert_array_equal(scores, np.concatenate([older, newer])[order])
+    np.testing.assert_array_equal(ids, order)
+
+
+def test_queries_match_brute_force_across_appends(tmp_path):
+    rng = np.random.default_rng(1)
+    index = ScoreIndex.create(str(tmp_path))
+    batches = [rng.random(size) for size in rng.integers(1, 500, 60)]
+    for batch in batches:
+        index.append(batch)
+    scores = np.concatenate(batches)
+
+    assert len(index) == len(scores)
+    assert len(index._runs) <= np.log2(len(scores)) + 1
+    thresholds = [0.90, 0.95, 0.98]
+    np.testing.assert_array_equal(index.count_recommended(thresholds), [(scores >= t).sum() for t in thresholds])
+    np.testing.assert_array_equal(np.sort(index.flips(0.98, 0.90)),
+                                  np.flatnonzero((scores >= 0.90) & (scores < 0.98)))
+    assert index.count_range(0.2, 0.4) == ((scores >= 0.2) & (scores < 0.4)).sum()
+    top_scores, top_ids = index.top(5)
+    np.testing.assert_array_equal(top_scores, np.sort(scores)[::-1][:5])
+    np.testing.assert_array_equal(scores[top_ids], top_scores)
+
+    reopened = open_score_index(str(tmp_path))
+    np.testing.assert_array_equal(reopened.count_recommended(thresholds), index.count_recommended(thresholds))
+    reopened.compact()
+    assert len(reopened._runs) == 1 and len(list(tmp_path.glob("run_*_scores.npy"))) == 1
+    np.testing.assert_array_equal(reopened._runs[0][0], np.sort(scores))
+
+
+def test_small_appends_do_not_rewrite_large_run(tmp_path):
+    index = ScoreIndex.create(str(tmp_path))
+    index.append(np.random.default_rng(2).random(100_000))
+    base = index.meta["runs"][0]
+    for _ in range(50):
+        index.append(np.random.default_rng(3).random(10))
+    assert index.meta["runs"][0] == base
@@ -0,0 +1,36 @@
+import numpy as np
+
+from pemev11.simplex import recommend_area_fraction, recommend_polygon, recommend_region
+
+
+def _polygon_area_fraction(vertices, count):
+    # Project onto (w_equity, w_sustainability); the simplex itself has area 1/2 there
+    x, y = vertices[:count, 1], vertices[:count, 2]
+    return abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2 / 0.5
+
+
+def test_clip_matches_brute_force():
+    rng = np.random.default_rng(11)
+    margins = rng.uniform(-1, 1, (200, 3))
+    margins[:10] = np.abs(margins[:10])  # all corners pass
+    margins[10:20] = -np.abs(margins[10:20])  # none pass
+    weights = rng.dirichlet(np.ones(3), 200_000)  # uniform on the simplex
+
+    fractions = recommend_area_fraction(margins)
+    vertices, counts = recommend_polygon(margins)
+    for g, fraction, polygon, count in zip(margins, fractions, vertices, counts):
+        assert abs(fraction - np.mean(weights @ g >= 0)) < 0.005
+        assert np.isclose(_polygon_area_fraction(polygon, count), fraction)
+        if count:
+            np.testing.assert_allclose(polygon[:count].sum(axis=1), 1.0)
+            assert (polygon[:count] >= -1e-12).all() and (polygon[:count] @ g >= -1e-12).all()
+        assert np.isnan(polygon[count:]).all()
+
+    np.testing.assert_array_equal(fractions[:10], 1.0)
+    np.testing.assert_array_equal(fractions[10:20], 0.0)
+
+
+def test_region_records_are_consistent():
+    region = recommend_region(10 ** np.linspace(0, 4, 50), 0.9, 0.95)
+    for row in region:
+        assert np.isclose(_polygon_area_fraction(row["vertices"], row["num_vertices"]), row["area_fraction"])
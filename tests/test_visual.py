@@ -0,0 +1,37 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pemev11 import visual
+from pemev11.vector import PlanetaryEnergyMasteryEthicalVector
+
+
+class _RecordingPool(ProcessPoolExecutor):
+    calls = []
+
+    def map(self, fn, chunks, **kwargs):
+        chunks = list(chunks)
+        self.calls.append((self._max_workers, [len(chunk) for chunk in chunks]))
+        return super().map(fn, chunks, **kwargs)
+
+
+def _variants(tmp_path, n):
+    vector = PlanetaryEnergyMasteryEthicalVector()
+    return [visual.landscape_variant(vector, str(tmp_path / f"v{i}.png")) for i in range(n)]
+
+
+@pytest.mark.parametrize("n, workers, chunks", [(4, 4, [1, 1, 1, 1]), (5, 2, [3, 2]), (3, 8, [1, 1, 1])])
+def test_variants_spread_over_all_workers(tmp_path, monkeypatch, n, workers, chunks):
+    monkeypatch.setattr(visual, "ProcessPoolExecutor", _RecordingPool)
+    _RecordingPool.calls.clear()
+    variants = _variants(tmp_path, n)
+    assert visual.render_landscapes(variants, workers) == [variant["path"] for variant in variants]
+    assert _RecordingPool.calls == [(min(n, workers), chunks)]
+    assert all((tmp_path / f"v{i}.png").stat().st_size for i in range(n))
+
+
+def test_single_worker_renders_serially(tmp_path, monkeypatch):
+    monkeypatch.setattr(visual, "ProcessPoolExecutor", None)
+    variants = _variants(tmp_path, 2)
+    assert visual.render_landscapes(variants, 1) == [variant["path"] for variant in variants]
+    assert visual.render_landscapes([], 4) == []